@@ -5,48 +5,82 @@ from stacks.dr_region_stack import DRRegionStack
 from stacks.global_resources_stack import GlobalResourcesStack
 from config.environments import PRODUCTION_CONFIG
 
-app = cdk.App()
+# Stacks each stack references, so a selected stack always gets its inputs built
+STACK_DEPENDENCIES = {
+    "EcommercePrimaryStack": set(),
+    "EcommerceDRStack": {"EcommercePrimaryStack"},
+    "EcommerceGlobalStack": {"EcommercePrimaryStack", "EcommerceDRStack"},
+}
+
+# Skip stack-trace capture for construct metadata, which slows down synth
+app = cdk.App(stack_traces=False)
 
 # Get environment from context or use production as default
 env_name = app.node.try_get_context("environment") or "production"
 config = PRODUCTION_CONFIG  # Could extend to support multiple environments
 
+# Optional stack selection: `-c skip_unused=1 -c stacks=EcommerceDRStack` only builds
+# the selected stacks (plus the stacks they depend on) instead of the whole app
+selected = set((app.node.try_get_context("stacks") or "").split(",")) - {""}
+skip_unused = app.node.try_get_context("skip_unused") == "1"
+
+if skip_unused and selected:
+    required = selected.union(*(STACK_DEPENDENCIES.get(name, set()) for name in selected))
+else:
+    required = set(STACK_DEPENDENCIES)
+
+# Resolve environment values once and reuse them for every stack
+account = app.account
+primary_region = config.primary_region.region
+dr_region = config.dr_region.region
+
 # Primary region (Sydney for Australian data sovereignty)
-primary_stack = PrimaryRegionStack(
-    app,
-    "EcommercePrimaryStack",
-    config=config,
-    env=cdk.Environment(region=config.primary_region.region, account=app.account),
-    description="E-commerce primary region infrastructure (Sydney)",
-)
+if "EcommercePrimaryStack" in required:
+    primary_stack = PrimaryRegionStack(
+        app,
+        "EcommercePrimaryStack",
+        config=config,
+        env=cdk.Environment(region=primary_region, account=account),
+        description="E-commerce primary region infrastructure (Sydney)",
+    )
 
 # DR region (Singapore for regional DR)
-dr_stack = DRRegionStack(
-    app,
-    "EcommerceDRStack",
-    config=config,
-    primary_database=primary_stack.database,
-    env=cdk.Environment(region=config.dr_region.region, account=app.account),
-    description="E-commerce DR region infrastructure (Singapore) - Pilot Light",
-)
+if "EcommerceDRStack" in required:
+    dr_stack = DRRegionStack(
+        app,
+        "EcommerceDRStack",
+        config=config,
+        primary_database=primary_stack.database,
+        env=cdk.Environment(region=dr_region, account=account),
+        # The read replica is created from the primary database in the other region
+        cross_region_references=True,
+        description="E-commerce DR region infrastructure (Singapore) - Pilot Light",
+    )
+    dr_stack.add_dependency(primary_stack)
 
 # Global resources (Route 53, etc.)
-global_stack = GlobalResourcesStack(
-    app,
-    "EcommerceGlobalStack",
-    config=config,
-    primary_alb_dns=primary_stack.load_balancer.load_balancer_dns_name,
-    dr_alb_dns=dr_stack.load_balancer.load_balancer_dns_name,
-    env=cdk.Environment(
-        region=config.primary_region.region,  # Global resources in primary region
-        account=app.account,
-    ),
-    description="E-commerce global resources (Route 53, DNS)",
-)
-
-# Stack dependencies
-dr_stack.add_dependency(primary_stack)
-global_stack.add_dependency(primary_stack)
-global_stack.add_dependency(dr_stack)
+if "EcommerceGlobalStack" in required:
+    global_stack = GlobalResourcesStack(
+        app,
+        "EcommerceGlobalStack",
+        config=config,
+        primary_alb_dns=primary_stack.load_balancer.load_balancer_dns_name,
+        primary_alb_zone_id=primary_stack.load_balancer.load_balancer_canonical_hosted_zone_id,
+        dr_alb_dns=dr_stack.load_balancer.load_balancer_dns_name,
+        dr_alb_zone_id=dr_stack.load_balancer.load_balancer_canonical_hosted_zone_id,
+        primary_health_alarm_name=primary_stack.compute_construct.healthy_hosts_alarm_name,
+        dr_health_alarm_name=dr_stack.compute_construct.healthy_hosts_alarm_name,
+        # `-c hosted_zone_id=Z...` reuses an existing zone instead of creating one
+        hosted_zone_id=app.node.try_get_context("hosted_zone_id"),
+        env=cdk.Environment(
+            region=primary_region,  # Global resources in primary region
+            account=account,
+        ),
+        # The DR ALB name and hosted zone are read from the DR region
+        cross_region_references=True,
+        description="E-commerce global resources (Route 53, DNS)",
+    )
+    # global -> primary is implied through the DR stack
+    global_stack.add_dependency(dr_stack)
 
 app.synth()
@@ -1,16 +1,18 @@
 from dataclasses import dataclass
-from typing import Dict, List, Optional
+from typing import Dict, Optional, Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class RegionConfig:
     region: str
-    availability_zones: List[str]
+    availability_zones: Tuple[str, ...]
     vpc_cidr: str
     nat_gateways: int
+    # ACM certificate for the regional ALB; the ALB serves plain HTTP when unset
+    certificate_arn: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class DatabaseConfig:
     instance_class: str
     engine_version: str
@@ -19,15 +21,19 @@ class DatabaseConfig:
     encrypted: bool
 
 
-@dataclass
+@dataclass(frozen=True)
 class ComputeConfig:
     instance_type: str
     min_capacity: int
     max_capacity: int
     desired_capacity: int
+    # Stopped, pre-initialised instances kept for the pilot light ASG (0 disables the warm pool)
+    warm_pool_min_size: int = 2
+    # SSM parameter holding a pre-baked AMI ID; packages are installed at boot when unset
+    golden_ami_ssm_parameter: Optional[str] = None
 
 
-@dataclass
+@dataclass(frozen=True)
 class EnvironmentConfig:
     environment_name: str
     primary_region: RegionConfig
@@ -43,13 +49,13 @@ PRODUCTION_CONFIG = EnvironmentConfig(
     environment_name="production",
     primary_region=RegionConfig(
         region="ap-southeast-2",  # Sydney - Australian data sovereignty
-        availability_zones=["ap-southeast-2a", "ap-southeast-2b", "ap-southeast-2c"],
+        availability_zones=("ap-southeast-2a", "ap-southeast-2b", "ap-southeast-2c"),
         vpc_cidr="10.0.0.0/16",
         nat_gateways=3,  # High availability
     ),
     dr_region=RegionConfig(
         region="ap-southeast-1",  # Singapore - Regional DR
-        availability_zones=["ap-southeast-1a", "ap-southeast-1b", "ap-southeast-1c"],
+        availability_zones=("ap-southeast-1a", "ap-southeast-1b", "ap-southeast-1c"),
         vpc_cidr="10.1.0.0/16",
         nat_gateways=2,  # Cost optimized pilot light
     ),
@@ -0,0 +1,7 @@
+from aws_cdk import aws_iam as iam
+
+# Service principals are scope-free, so one instance per service is shared by every role
+EC2_PRINCIPAL = iam.ServicePrincipal("ec2.amazonaws.com")
+LAMBDA_PRINCIPAL = iam.ServicePrincipal("lambda.amazonaws.com")
+CONFIG_PRINCIPAL = iam.ServicePrincipal("config.amazonaws.com")
+S3_PRINCIPAL = iam.ServicePrincipal("s3.amazonaws.com")
@@ -1,14 +1,23 @@
+from typing import Optional
+
 from aws_cdk import (
+    aws_cloudwatch as cloudwatch,
+    aws_dynamodb as dynamodb,
     aws_lambda as lambda_,
+    aws_rds as rds,
     aws_iam as iam,
     aws_events as events,
     aws_events_targets as targets,
     aws_stepfunctions as sfn,
     aws_stepfunctions_tasks as tasks,
     aws_sns as sns,
+    ArnFormat,
     Duration,
+    RemovalPolicy,
+    Stack,
 )
 from constructs import Construct
+from constructs._iam_principals import LAMBDA_PRINCIPAL
 
 
 class DROrchestrator(Construct):
@@ -18,18 +27,22 @@ class DROrchestrator(Construct):
     """
 
     def __init__(
-        self, scope: Construct, construct_id: str, notification_topic: sns.Topic, **kwargs
+        self,
+        scope: Construct,
+        construct_id: str,
+        notification_topic: sns.Topic,
+        replica_database: rds.IDatabaseInstance,
+        pilot_light_alarm: Optional[cloudwatch.IAlarm] = None,
+        **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        # IAM Role for DR operations
+        # IAM Role for DR operations, limited to the API calls the DR handlers make
+        stack = Stack.of(self)
         self.dr_execution_role = iam.Role(
             self,
             "DRExecutionRole",
-            assumed_by=iam.CompositePrincipal(
-                iam.ServicePrincipal("lambda.amazonaws.com"),
-                iam.ServicePrincipal("states.amazonaws.com"),
-            ),
+            assumed_by=LAMBDA_PRINCIPAL,
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name(
                     "service-role/AWSLambdaBasicExecutionRole"
@@ -38,46 +51,156 @@ class DROrchestrator(Construct):
             inline_policies={
                 "DROperationsPolicy": iam.PolicyDocument(
                     statements=[
+                        # Failover only scales and promotes resources in this region
+                        iam.PolicyStatement(
+                            actions=["autoscaling:UpdateAutoScalingGroup"],
+                            resources=[
+                                stack.format_arn(
+                                    service="autoscaling",
+                                    resource="autoScalingGroup",
+                                    resource_name="*",
+                                    arn_format=ArnFormat.COLON_RESOURCE_NAME,
+                                )
+                            ],
+                        ),
+                        iam.PolicyStatement(
+                            actions=["rds:PromoteReadReplica"],
+                            resources=[
+                                stack.format_arn(
+                                    service="rds",
+                                    resource="db",
+                                    resource_name="*",
+                                    arn_format=ArnFormat.COLON_RESOURCE_NAME,
+                                )
+                            ],
+                        ),
+                        # Read-only describes (the health check may target another region) and task tokens
                         iam.PolicyStatement(
                             actions=[
-                                "autoscaling:UpdateAutoScalingGroup",
-                                "rds:PromoteReadReplica",
+                                "autoscaling:DescribeAutoScalingGroups",
                                 "rds:DescribeDBInstances",
-                                "elasticloadbalancing:DescribeTargetHealth",
-                                "sns:Publish",
+                                "states:SendTaskSuccess",
                             ],
                             resources=["*"],
-                        )
+                        ),
                     ]
                 )
             },
         )
 
-        # Lambda Functions
-        self.failover_function = self._create_lambda_function("Failover", "failover.py")
-        self.health_check_function = self._create_lambda_function("HealthCheck", "health_check.py")
+        # Task tokens of failovers waiting for their promoted database, keyed by replica ID
+        self.token_table = dynamodb.Table(
+            self,
+            "FailoverTokenTable",
+            partition_key=dynamodb.Attribute(name="replica_id", type=dynamodb.AttributeType.STRING),
+            billing_mode=dynamodb.BillingMode.PAY_PER_REQUEST,
+            time_to_live_attribute="expires_at",
+            removal_policy=RemovalPolicy.DESTROY,
+        )
+        self.token_table.grant_read_write_data(self.dr_execution_role)
+
+        # Lambda Function: a single function dispatches every DR step on its "action"
+        self.dr_ops_function = self._create_dr_ops_function()
+        # Invokers target the alias, since SnapStart only applies to published versions
+        self.dr_ops_alias = lambda_.Alias(
+            self,
+            "DROperationsAlias",
+            alias_name="live",
+            version=self.dr_ops_function.current_version,
+        )
 
-        # Step Function for DR orchestration
+        # Step Functions: Standard workflow for the durable failover, Express for the fast path
+        self.failover_state_machine = self._create_failover_state_machine()
         self.dr_state_machine = self._create_dr_state_machine(notification_topic)
 
         # EventBridge rules
-        self._create_event_rules()
+        self._create_event_rules(pilot_light_alarm, replica_database)
 
-    def _create_lambda_function(self, name: str, filename: str) -> lambda_.Function:
-        """Create Lambda function from external file"""
-        return lambda_.Function(
+    def _create_dr_ops_function(self) -> lambda_.Function:
+        """Create the Lambda function serving all DR operations from lambda_functions/"""
+        function = lambda_.Function(
             self,
-            f"{name}Function",
-            runtime=lambda_.Runtime.PYTHON_3_11,
-            handler="index.handler",
+            "DROperationsFunction",
+            runtime=lambda_.Runtime.PYTHON_3_12,
+            # Handlers are pure Python, so Graviton runs them cheaper with no native wheels to rebuild
+            architecture=lambda_.Architecture.ARM_64,
+            handler="dr_operations.handler",
             role=self.dr_execution_role,
             timeout=Duration.minutes(15),
-            memory_size=512,
-            code=lambda_.Code.from_asset(f"lambda_functions/{filename}"),
+            # 1769 MB is one full vCPU, so imports and TLS setup on the failover path aren't throttled
+            memory_size=1769,
+            # Bytecode from local test runs would otherwise change the asset hash
+            code=lambda_.Code.from_asset("lambda_functions", exclude=["__pycache__", "*.pyc"]),
+            environment={"TABLE_NAME": self.token_table.table_name},
+        )
+
+        # SnapStart restores an initialised snapshot instead of a cold start on the failover path.
+        # The L2 Function only allows it for Java runtimes in this CDK version.
+        function.node.default_child.snap_start = lambda_.CfnFunction.SnapStartProperty(
+            apply_on="PublishedVersions"
+        )
+        return function
+
+    def _invoke_dr_operation(
+        self, construct_id: str, action: str, timeout: Duration
+    ) -> tasks.LambdaInvoke:
+        """Invoke the DR operations function with the current state as the action's input"""
+        return tasks.LambdaInvoke(
+            self,
+            construct_id,
+            lambda_function=self.dr_ops_alias,
+            payload=sfn.TaskInput.from_object(
+                {"action": action, "input": sfn.JsonPath.entire_payload}
+            ),
+            payload_response_only=True,
+            # Steps share one function, so each gets its own budget instead of the 15 min limit
+            task_timeout=sfn.Timeout.duration(timeout),
+        )
+
+    def _create_failover_state_machine(self) -> sfn.StateMachine:
+        """Create Standard state machine that runs the failover itself"""
+
+        failover = self._invoke_dr_operation("Failover", "failover", Duration.minutes(15))
+
+        # Failover only waits for the ASG; the database wait happens here, outside the Lambda
+        # budget, resuming as soon as the promoted replica is available
+        wait_for_database = tasks.LambdaInvoke(
+            self,
+            "WaitForDatabase",
+            lambda_function=self.dr_ops_alias,
+            integration_pattern=sfn.IntegrationPattern.WAIT_FOR_TASK_TOKEN,
+            payload=sfn.TaskInput.from_object(
+                {
+                    "action": "db_available",
+                    "input": {
+                        "task_token": sfn.JsonPath.task_token,
+                        "replica_id": sfn.JsonPath.string_at("$.body.replica_id"),
+                    },
+                }
+            ),
+            task_timeout=sfn.Timeout.duration(Duration.minutes(20)),
+        )
+
+        definition = failover.next(
+            sfn.Choice(self, "FailoverSucceeded")
+            .when(
+                sfn.Condition.number_equals("$.statusCode", 200),
+                wait_for_database.next(sfn.Succeed(self, "Success")),
+            )
+            .otherwise(sfn.Fail(self, "FailoverFailed"))
+        )
+
+        # Standard workflow keeps a durable execution history for the failover; the timeout
+        # covers both task budgets (15 + 20 min) with headroom for the state transitions
+        return sfn.StateMachine(
+            self,
+            "FailoverStateMachine",
+            definition=definition,
+            timeout=Duration.minutes(40),
         )
 
     def _create_dr_state_machine(self, notification_topic: sns.Topic) -> sfn.StateMachine:
-        """Create Step Function state machine for DR orchestration"""
+        """Create Express state machine for the notify + health check -> decide fast path"""
 
         # Define tasks
         notify = tasks.SnsPublish(
@@ -87,49 +210,64 @@ class DROrchestrator(Construct):
             message=sfn.TaskInput.from_json_path_at("$.message"),
         )
 
-        health_check = tasks.LambdaInvoke(
-            self,
-            "HealthCheck",
-            lambda_function=self.health_check_function,
-            payload_response_only=True,
+        health_check = self._invoke_dr_operation(
+            "HealthCheck", "health_check", Duration.seconds(30)
         )
 
-        failover = tasks.LambdaInvoke(
-            self, "Failover", lambda_function=self.failover_function, payload_response_only=True
+        # Express workflows cannot use .sync/.waitForTaskToken, so hand off and return
+        start_failover = tasks.StepFunctionsStartExecution(
+            self,
+            "StartFailover",
+            state_machine=self.failover_state_machine,
+            integration_pattern=sfn.IntegrationPattern.REQUEST_RESPONSE,
+            input=sfn.TaskInput.from_json_path_at("$"),
         )
 
-        wait = sfn.Wait(self, "Wait", time=sfn.WaitTime.duration(Duration.minutes(2)))
+        # Notify and check are independent, so run them together and keep the check's result
+        notify_and_check = sfn.Parallel(self, "NotifyAndCheck", output_path="$[1]")
+        notify_and_check.branch(notify).branch(health_check)
 
-        # Simple workflow: notify -> check -> failover if needed -> wait -> success
-        definition = notify.next(
-            health_check.next(
-                sfn.Choice(self, "IsHealthy")
-                .when(
-                    sfn.Condition.boolean_equals("$.body.overall_healthy", False),
-                    failover.next(wait.next(sfn.Succeed(self, "Success"))),
-                )
-                .otherwise(sfn.Succeed(self, "Healthy"))
+        # Simple workflow: notify + check -> start failover if needed
+        definition = notify_and_check.next(
+            sfn.Choice(self, "IsHealthy")
+            .when(
+                sfn.Condition.boolean_equals("$.body.overall_healthy", False),
+                start_failover.next(sfn.Succeed(self, "FailoverStarted")),
             )
+            .otherwise(sfn.Succeed(self, "Healthy"))
         )
 
         return sfn.StateMachine(
             self,
             "DRStateMachine",
             definition=definition,
-            role=self.dr_execution_role,
-            timeout=Duration.minutes(30),
+            state_machine_type=sfn.StateMachineType.EXPRESS,
+            timeout=Duration.minutes(5),
         )
 
-    def _create_event_rules(self):
+    def _create_event_rules(
+        self,
+        pilot_light_alarm: Optional[cloudwatch.IAlarm],
+        replica_database: rds.IDatabaseInstance,
+    ):
         """Create EventBridge rules for automated DR triggers"""
 
+        # Only this stack's alarms drive DR; CloudFormation names them "<stack name>-..."
+        stack_alarms = [{"prefix": f"{Stack.of(self).stack_name}-"}]
+        # An alarm that is expected to fire while DR is idle (e.g. healthy hosts on the
+        # scaled-to-zero ASG) is excluded by ARN, so it can't start a failover
+        idle_alarm = (
+            events.Match.anything_but(pilot_light_alarm.alarm_arn) if pilot_light_alarm else None
+        )
+
         alarm_rule = events.Rule(
             self,
             "AlarmRule",
             event_pattern=events.EventPattern(
                 source=["aws.cloudwatch"],
                 detail_type=["CloudWatch Alarm State Change"],
-                detail={"state": {"value": ["ALARM"]}},
+                resources=idle_alarm,
+                detail={"alarmName": stack_alarms, "state": {"value": ["ALARM"]}},
             ),
         )
 
@@ -141,3 +279,43 @@ class DROrchestrator(Construct):
                 ),
             )
         )
+
+        # Pre-warm the DR Lambda while alarms degrade, so a real failover avoids a cold start
+        events.Rule(
+            self,
+            "WarmupRule",
+            event_pattern=events.EventPattern(
+                source=["aws.cloudwatch"],
+                detail_type=["CloudWatch Alarm State Change"],
+                resources=idle_alarm,
+                detail={"alarmName": stack_alarms, "state": {"value": ["INSUFFICIENT_DATA"]}},
+            ),
+            targets=[
+                targets.LambdaFunction(
+                    self.dr_ops_alias, event=events.RuleTargetInput.from_object({"warmup": True})
+                )
+            ],
+        )
+
+        # Availability events of the replica resume a failover waiting on its promotion
+        events.Rule(
+            self,
+            "DatabaseAvailableRule",
+            event_pattern=events.EventPattern(
+                source=["aws.rds"],
+                detail_type=["RDS DB Instance Event"],
+                resources=[replica_database.instance_arn],
+                detail={"EventCategories": ["availability"]},
+            ),
+            targets=[
+                targets.LambdaFunction(
+                    self.dr_ops_alias,
+                    event=events.RuleTargetInput.from_object(
+                        {
+                            "action": "db_available",
+                            "input": {"detail": events.EventField.from_path("$.detail")},
+                        }
+                    ),
+                )
+            ],
+        )
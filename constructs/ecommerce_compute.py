@@ -1,3 +1,5 @@
+import json
+
 from aws_cdk import (
     aws_ec2 as ec2,
     aws_autoscaling as autoscaling,
@@ -5,14 +7,20 @@ from aws_cdk import (
     aws_elasticloadbalancingv2_targets as targets,
     aws_iam as iam,
     aws_cloudwatch as cloudwatch,
+    aws_cloudwatch_actions as cw_actions,
+    aws_s3 as s3,
+    aws_secretsmanager as secretsmanager,
     aws_sns as sns,
     aws_ssm as ssm,
+    ArnFormat,
     Duration,
+    Stack,
     Tags,
 )
 from constructs import Construct
+from constructs._iam_principals import EC2_PRINCIPAL
 from config.environments import ComputeConfig
-from typing import List
+from typing import Optional
 
 
 class EcommerceCompute(Construct):
@@ -21,15 +29,21 @@ class EcommerceCompute(Construct):
     Includes Auto Scaling, Load Balancing, and comprehensive monitoring
     """
 
+    LAUNCH_HOOK_NAME = "InstanceReady"
+
     def __init__(
         self,
         scope: Construct,
         construct_id: str,
         vpc: ec2.Vpc,
         config: ComputeConfig,
-        security_groups: List[ec2.SecurityGroup],
+        instance_security_group: ec2.SecurityGroup,
+        alb_security_group: ec2.SecurityGroup,
         notification_topic: sns.Topic,
         is_pilot_light: bool = False,
+        certificate_arn: Optional[str] = None,
+        bucket: Optional[s3.IBucket] = None,
+        secret: Optional[secretsmanager.ISecret] = None,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -42,7 +56,7 @@ class EcommerceCompute(Construct):
         self.instance_role = iam.Role(
             self,
             "InstanceRole",
-            assumed_by=iam.ServicePrincipal("ec2.amazonaws.com"),
+            assumed_by=EC2_PRINCIPAL,
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name("AmazonSSMManagedInstanceCore"),
                 iam.ManagedPolicy.from_aws_managed_policy_name("CloudWatchAgentServerPolicy"),
@@ -50,86 +64,109 @@ class EcommerceCompute(Construct):
             inline_policies={
                 "EcommerceAppPolicy": iam.PolicyDocument(
                     statements=[
-                        iam.PolicyStatement(
-                            actions=[
-                                "s3:GetObject",
-                                "s3:PutObject",
-                                "secretsmanager:GetSecretValue",
-                                "rds:DescribeDBInstances",
-                            ],
-                            resources=["*"],
-                        )
+                        # DescribeDBInstances is authorised account-wide, not per instance
+                        iam.PolicyStatement(actions=["rds:DescribeDBInstances"], resources=["*"])
                     ]
                 )
             },
         )
 
+        # Application data and database credentials, scoped to the resources passed in
+        if bucket:
+            bucket.grant_read(self.instance_role)
+            bucket.grant_put(self.instance_role)
+        if secret:
+            secret.grant_read(self.instance_role)
+
         self.instance_profile = iam.InstanceProfile(
             self, "InstanceProfile", role=self.instance_role
         )
 
+        # CloudWatch Agent configuration: per-group metrics, app metrics as EMF log events.
+        # Kept in SSM so config changes do not create a new launch template version
+        self.cw_agent_config = ssm.StringParameter(
+            self,
+            "CWAgentConfig",
+            description="CloudWatch agent configuration for e-commerce instances",
+            string_value=json.dumps(
+                {
+                    # The agent stays root so it can read /var/log/messages (0600). Without
+                    # the host dimension, instances of a group publish one shared series
+                    "agent": {"metrics_collection_interval": 60, "omit_hostname": True},
+                    "metrics": {
+                        "namespace": "ECommerce/Application",
+                        "append_dimensions": {
+                            "AutoScalingGroupName": "${aws:AutoScalingGroupName}"
+                        },
+                        "metrics_collected": {
+                            "cpu": {"measurement": ["cpu_usage_idle", "cpu_usage_iowait"]},
+                            "disk": {"measurement": ["used_percent"], "resources": ["*"]},
+                            "mem": {"measurement": ["mem_used_percent"]},
+                            "netstat": {"measurement": ["tcp_established", "tcp_time_wait"]},
+                        },
+                    },
+                    "logs": {
+                        "metrics_collected": {"emf": {}},
+                        "logs_collected": {
+                            "files": {
+                                "collect_list": [
+                                    {
+                                        "file_path": "/var/log/messages",
+                                        "log_group_name": "/aws/ec2/ecommerce/system",
+                                        "log_stream_name": "{instance_id}",
+                                    },
+                                    {
+                                        "file_path": "/var/log/ecommerce/app.log",
+                                        "log_group_name": "/aws/ec2/ecommerce/application",
+                                        "log_stream_name": "{instance_id}",
+                                    },
+                                ]
+                            }
+                        },
+                    },
+                }
+            ),
+        )
+        self.cw_agent_config.grant_read(self.instance_role)
+
         # User Data for application setup
         user_data = ec2.UserData.for_linux()
+        if not config.golden_ami_ssm_parameter:
+            # Stock AMI: install packages at boot (a golden AMI has these baked in)
+            user_data.add_commands(
+                "yum update -y",
+                "yum install -y amazon-cloudwatch-agent",
+                "yum install -y docker",
+                "yum install -y nginx",
+                "systemctl enable docker",
+                "systemctl enable nginx",
+                "usermod -a -G docker ec2-user",
+            )
         user_data.add_commands(
-            "yum update -y",
-            "yum install -y amazon-cloudwatch-agent",
-            "yum install -y docker",
             "systemctl start docker",
-            "systemctl enable docker",
-            "usermod -a -G docker ec2-user",
-            # CloudWatch Agent configuration
-            "cat > /opt/aws/amazon-cloudwatch-agent/etc/amazon-cloudwatch-agent.json << 'EOF'",
-            """{
-                "metrics": {
-                    "namespace": "ECommerce/Application",
-                    "metrics_collected": {
-                        "cpu": {"measurement": ["cpu_usage_idle", "cpu_usage_iowait"]},
-                        "disk": {"measurement": ["used_percent"], "resources": ["*"]},
-                        "mem": {"measurement": ["mem_used_percent"]},
-                        "netstat": {"measurement": ["tcp_established", "tcp_time_wait"]}
-                    }
-                },
-                "logs": {
-                    "logs_collected": {
-                        "files": {
-                            "collect_list": [
-                                {
-                                    "file_path": "/var/log/messages",
-                                    "log_group_name": "/aws/ec2/ecommerce/system",
-                                    "log_stream_name": "{instance_id}"
-                                },
-                                {
-                                    "file_path": "/var/log/ecommerce/app.log",
-                                    "log_group_name": "/aws/ec2/ecommerce/application",
-                                    "log_stream_name": "{instance_id}"
-                                }
-                            ]
-                        }
-                    }
-                }
-            }""",
-            "EOF",
-            "/opt/aws/amazon-cloudwatch-agent/bin/amazon-cloudwatch-agent-ctl -a fetch-config -m ec2 -c file:/opt/aws/amazon-cloudwatch-agent/etc/amazon-cloudwatch-agent.json -s",
+            # CloudWatch Agent configuration is fetched from SSM Parameter Store
+            "/opt/aws/amazon-cloudwatch-agent/bin/amazon-cloudwatch-agent-ctl -a fetch-config "
+            f"-m ec2 -c ssm:{self.cw_agent_config.parameter_name} -s",
             # Sample e-commerce application (placeholder)
             "mkdir -p /var/log/ecommerce",
             "echo 'E-commerce application starting...' > /var/log/ecommerce/app.log",
             # Health check endpoint
-            "yum install -y nginx",
             "systemctl start nginx",
-            "systemctl enable nginx",
             "echo 'healthy' > /var/www/html/health",
         )
 
+        # Warm pool: pre-initialised instances are stopped and resumed on failover
+        use_warm_pool = is_pilot_light and config.warm_pool_min_size > 0
+        if use_warm_pool:
+            self._add_lifecycle_completion(user_data)
+
         # Launch Template
         self.launch_template = ec2.LaunchTemplate(
             self,
             "LaunchTemplate",
             instance_type=ec2.InstanceType(config.instance_type),
-            machine_image=ec2.AmazonLinuxImage(
-                generation=ec2.AmazonLinuxGeneration.AMAZON_LINUX_2,
-                cpu_type=ec2.AmazonLinuxCpuType.X86_64,
-            ),
-            security_group=security_groups[0],
+            machine_image=self._machine_image(),
+            security_group=instance_security_group,
             user_data=user_data,
             role=self.instance_role,
             detailed_monitoring=True,
@@ -167,6 +204,9 @@ class EcommerceCompute(Construct):
             ),
         )
 
+        if use_warm_pool:
+            self._create_warm_pool()
+
         # Application Load Balancer
         self.load_balancer = elbv2.ApplicationLoadBalancer(
             self,
@@ -174,7 +214,9 @@ class EcommerceCompute(Construct):
             vpc=vpc,
             internet_facing=True,
             vpc_subnets=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PUBLIC),
-            security_group=security_groups[1] if len(security_groups) > 1 else security_groups[0],
+            security_group=alb_security_group,
+            http2_enabled=True,
+            idle_timeout=Duration.seconds(120),
         )
 
         # Target Group
@@ -185,25 +227,37 @@ class EcommerceCompute(Construct):
             port=80,
             protocol=elbv2.ApplicationProtocol.HTTP,
             targets=[self.auto_scaling_group],
+            # 15s x 3 checks: unhealthy targets are rotated out within ~45s
             health_check=elbv2.HealthCheck(
                 enabled=True,
                 healthy_http_codes="200",
                 path="/health",
                 protocol=elbv2.Protocol.HTTP,
                 timeout=Duration.seconds(5),
-                interval=Duration.seconds(30),
-                healthy_threshold_count=2,
+                interval=Duration.seconds(15),
+                healthy_threshold_count=3,
                 unhealthy_threshold_count=3,
             ),
         )
 
-        # Listener
-        self.listener = self.load_balancer.add_listener(
-            "Listener",
-            port=80,
-            protocol=elbv2.ApplicationProtocol.HTTP,
-            default_target_groups=[self.target_group],
-        )
+        # Listener: HTTPS (HTTP/2) with an HTTP redirect when a certificate is configured
+        if certificate_arn:
+            self.listener = self.load_balancer.add_listener(
+                "HttpsListener",
+                port=443,
+                protocol=elbv2.ApplicationProtocol.HTTPS,
+                certificates=[elbv2.ListenerCertificate.from_arn(certificate_arn)],
+                ssl_policy=elbv2.SslPolicy.TLS12_EXT,
+                default_target_groups=[self.target_group],
+            )
+            self.load_balancer.add_redirect(source_port=80, target_port=443)
+        else:
+            self.listener = self.load_balancer.add_listener(
+                "Listener",
+                port=80,
+                protocol=elbv2.ApplicationProtocol.HTTP,
+                default_target_groups=[self.target_group],
+            )
 
         # Auto Scaling Policies
         if not is_pilot_light:
@@ -217,67 +271,175 @@ class EcommerceCompute(Construct):
         Tags.of(self).add("Application", "E-commerce")
         Tags.of(self).add("PilotLight", str(is_pilot_light))
 
+    def _machine_image(self) -> ec2.IMachineImage:
+        """Golden AMI from SSM when configured, otherwise stock Amazon Linux 2"""
+        if self.config.golden_ami_ssm_parameter:
+            return ec2.MachineImage.from_ssm_parameter(
+                self.config.golden_ami_ssm_parameter, os=ec2.OperatingSystemType.LINUX
+            )
+        return ec2.AmazonLinuxImage(
+            generation=ec2.AmazonLinuxGeneration.AMAZON_LINUX_2,
+            cpu_type=ec2.AmazonLinuxCpuType.X86_64,
+        )
+
+    def _add_lifecycle_completion(self, user_data: ec2.UserData):
+        """Complete the launch lifecycle action once user data is done, on every boot"""
+        region = Stack.of(self).region
+        script = "/var/lib/cloud/scripts/per-boot/complete-lifecycle-action.sh"
+
+        # Instances resumed from the warm pool skip user data, so also run it as a per-boot script
+        user_data.add_commands(
+            f"cat > {script} << 'EOF'",
+            "#!/bin/bash",
+            "TOKEN=$(curl -s -X PUT http://169.254.169.254/latest/api/token "
+            "-H 'X-aws-ec2-metadata-token-ttl-seconds: 300')",
+            'INSTANCE_ID=$(curl -s -H "X-aws-ec2-metadata-token: $TOKEN" '
+            "http://169.254.169.254/latest/meta-data/instance-id)",
+            f"ASG_NAME=$(aws autoscaling describe-auto-scaling-instances --region {region} "
+            "--instance-ids $INSTANCE_ID "
+            "--query 'AutoScalingInstances[0].AutoScalingGroupName' --output text)",
+            f"aws autoscaling complete-lifecycle-action --region {region} "
+            f"--lifecycle-hook-name {self.LAUNCH_HOOK_NAME} --auto-scaling-group-name $ASG_NAME "
+            "--instance-id $INSTANCE_ID --lifecycle-action-result CONTINUE",
+            "EOF",
+            f"chmod +x {script}",
+            script,
+        )
+
+        # Group name is looked up at boot; referencing the ASG here would create a cycle
+        self.instance_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=["autoscaling:CompleteLifecycleAction"],
+                resources=[
+                    Stack.of(self).format_arn(
+                        service="autoscaling",
+                        resource="autoScalingGroup",
+                        resource_name="*",
+                        arn_format=ArnFormat.COLON_RESOURCE_NAME,
+                    )
+                ],
+            )
+        )
+        self.instance_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=["autoscaling:DescribeAutoScalingInstances"], resources=["*"]
+            )
+        )
+
+    def _create_warm_pool(self):
+        """Keep stopped, fully initialised instances ready for a DR scale-up"""
+        self.auto_scaling_group.add_lifecycle_hook(
+            "LaunchHook",
+            lifecycle_hook_name=self.LAUNCH_HOOK_NAME,
+            lifecycle_transition=autoscaling.LifecycleTransition.INSTANCE_LAUNCHING,
+            default_result=autoscaling.DefaultResult.CONTINUE,
+            heartbeat_timeout=Duration.minutes(10),
+        )
+
+        self.warm_pool = self.auto_scaling_group.add_warm_pool(
+            min_size=self.config.warm_pool_min_size,
+            max_group_prepared_capacity=self.config.min_capacity,
+            pool_state=autoscaling.PoolState.STOPPED,
+        )
+
     def _create_scaling_policies(self, notification_topic: sns.Topic):
         """Create auto scaling policies based on metrics"""
 
-        # Scale Up Policy
-        scale_up_policy = self.auto_scaling_group.scale_on_metric(
+        # CPU target tracking reacts before response time degrades; short warm-up so new
+        # instances count towards the target quickly
+        self.auto_scaling_group.scale_on_cpu_utilization(
+            "CpuTargetTracking",
+            target_utilization_percent=60,
+            estimated_instance_warmup=Duration.seconds(60),
+        )
+
+        response_time = cloudwatch.Metric(
+            namespace="AWS/ApplicationELB",
+            metric_name="TargetResponseTime",
+            dimensions_map={"LoadBalancer": self.load_balancer.load_balancer_full_name},
+            period=Duration.minutes(1),
+        )
+
+        # Scale Up Policy (change=0 interval marks the no-op range below 1s)
+        self.auto_scaling_group.scale_on_metric(
             "ScaleUpPolicy",
-            metric=cloudwatch.Metric(
-                namespace="AWS/ApplicationELB",
-                metric_name="TargetResponseTime",
-                dimensions_map={"LoadBalancer": self.load_balancer.load_balancer_full_name},
-            ),
+            metric=response_time,
             scaling_steps=[
-                autoscaling.ScalingInterval(upper=1.0, change=1),
-                autoscaling.ScalingInterval(lower=1.0, change=2),
+                autoscaling.ScalingInterval(upper=1.0, change=0),
+                autoscaling.ScalingInterval(lower=1.0, change=1),
+                autoscaling.ScalingInterval(lower=2.0, change=2),
             ],
             adjustment_type=autoscaling.AdjustmentType.CHANGE_IN_CAPACITY,
             cooldown=Duration.minutes(5),
         )
 
         # Scale Down Policy
-        scale_down_policy = self.auto_scaling_group.scale_on_metric(
+        self.auto_scaling_group.scale_on_metric(
             "ScaleDownPolicy",
-            metric=cloudwatch.Metric(
-                namespace="AWS/ApplicationELB",
-                metric_name="TargetResponseTime",
-                dimensions_map={"LoadBalancer": self.load_balancer.load_balancer_full_name},
-            ),
-            scaling_steps=[autoscaling.ScalingInterval(upper=0.5, change=-1)],
+            metric=response_time,
+            scaling_steps=[
+                autoscaling.ScalingInterval(upper=0.5, change=-1),
+                autoscaling.ScalingInterval(lower=0.5, change=0),
+            ],
             adjustment_type=autoscaling.AdjustmentType.CHANGE_IN_CAPACITY,
             cooldown=Duration.minutes(10),
         )
 
+        # Request count per target is a leading indicator; the step policies stay as a safety net
+        self.auto_scaling_group.scale_on_request_count(
+            "ReqPerTarget",
+            target_requests_per_minute=1000,
+            estimated_instance_warmup=Duration.seconds(90),
+        )
+
     def _create_compute_alarms(self, notification_topic: sns.Topic):
-        """Create CloudWatch alarms for compute infrastructure"""
+        """Create CloudWatch alarms for compute infrastructure on 1-minute datapoints"""
+
+        # Healthy hosts, backing the Route 53 health check; the name is deterministic so the
+        # global stack can reference it from another region
+        self.healthy_hosts_alarm_name = f"{Stack.of(self).stack_name}-HealthyHosts"
+        self.healthy_hosts_alarm = cloudwatch.Alarm(
+            self,
+            "HealthyHostsAlarm",
+            alarm_name=self.healthy_hosts_alarm_name,
+            metric=self.target_group.metric_healthy_host_count(period=Duration.minutes(1)),
+            threshold=1,
+            evaluation_periods=1,
+            comparison_operator=cloudwatch.ComparisonOperator.LESS_THAN_THRESHOLD,
+            treat_missing_data=cloudwatch.TreatMissingData.BREACHING,
+            alarm_description="No healthy targets behind the load balancer",
+        )
 
         # ALB Target Health
         cloudwatch.Alarm(
             self,
             "UnhealthyTargetsAlarm",
-            metric=self.target_group.metric_unhealthy_host_count(),
+            metric=self.target_group.metric_unhealthy_host_count(period=Duration.minutes(1)),
             threshold=1,
             evaluation_periods=2,
             alarm_description="Unhealthy targets detected",
-        ).add_alarm_action(cloudwatch.SnsAction(notification_topic))
+        ).add_alarm_action(cw_actions.SnsAction(notification_topic))
 
         # ALB Response Time
         cloudwatch.Alarm(
             self,
             "HighResponseTimeAlarm",
-            metric=self.target_group.metric_target_response_time(),
+            metric=self.target_group.metric_target_response_time(period=Duration.minutes(1)),
             threshold=2.0,
             evaluation_periods=2,
             alarm_description="High response time detected",
-        ).add_alarm_action(cloudwatch.SnsAction(notification_topic))
+        ).add_alarm_action(cw_actions.SnsAction(notification_topic))
 
         # ALB 5XX Errors
         cloudwatch.Alarm(
             self,
             "HighErrorRateAlarm",
-            metric=self.load_balancer.metric_target_response_time(),
+            metric=self.load_balancer.metric_http_code_target(
+                elbv2.HttpCodeTarget.TARGET_5XX_COUNT,
+                period=Duration.minutes(1),
+                statistic="Sum",
+            ),
             threshold=10,
             evaluation_periods=2,
             alarm_description="High error rate detected",
-        ).add_alarm_action(cloudwatch.SnsAction(notification_topic))
+        ).add_alarm_action(cw_actions.SnsAction(notification_topic))
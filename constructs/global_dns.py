@@ -1,11 +1,12 @@
 from aws_cdk import (
     aws_route53 as route53,
-    aws_route53_targets as targets,
     aws_cloudwatch as cloudwatch,
+    aws_cloudwatch_actions as cw_actions,
     aws_sns as sns,
     Duration,
 )
 from constructs import Construct
+from typing import Optional
 
 
 class GlobalDNS(Construct):
@@ -19,61 +20,100 @@ class GlobalDNS(Construct):
         construct_id: str,
         domain_name: str,
         primary_alb_dns: str,
+        primary_alb_zone_id: str,
         dr_alb_dns: str,
+        dr_alb_zone_id: str,
+        primary_health_alarm_name: str,
+        dr_health_alarm_name: str,
+        primary_region: str,
+        dr_region: str,
         notification_topic: sns.Topic,
+        hosted_zone_id: Optional[str] = None,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        # Hosted Zone
-        self.hosted_zone = route53.HostedZone(self, "HostedZone", zone_name=domain_name)
+        # Hosted Zone: reuse an existing zone when given, so DNS and NS records survive redeploys
+        if hosted_zone_id:
+            self.hosted_zone = route53.HostedZone.from_hosted_zone_attributes(
+                self, "HostedZone", hosted_zone_id=hosted_zone_id, zone_name=domain_name
+            )
+        else:
+            self.hosted_zone = route53.HostedZone(self, "HostedZone", zone_name=domain_name)
 
-        # Health Checks
-        self.primary_health_check = route53.CfnHealthCheck(
-            self,
-            "PrimaryHealthCheck",
-            type="HTTPS",
-            resource_path="/health",
-            fully_qualified_domain_name=primary_alb_dns,
-            request_interval=30,
-            failure_threshold=3,
+        # Health Checks follow each region's healthy-hosts alarm instead of polling /health
+        self.primary_health_check = self._create_alarm_health_check(
+            "PrimaryHealthCheck", primary_health_alarm_name, primary_region
         )
-
-        self.dr_health_check = route53.CfnHealthCheck(
-            self,
-            "DRHealthCheck",
-            type="HTTPS",
-            resource_path="/health",
-            fully_qualified_domain_name=dr_alb_dns,
-            request_interval=30,
-            failure_threshold=3,
+        self.dr_health_check = self._create_alarm_health_check(
+            "DRHealthCheck", dr_health_alarm_name, dr_region
         )
 
-        # DNS Records with Failover
-        self.primary_record = route53.ARecord(
+        # DNS Records with Failover, applied together in one ChangeResourceRecordSets batch
+        self.failover_records = route53.CfnRecordSetGroup(
             self,
-            "PrimaryRecord",
-            zone=self.hosted_zone,
-            record_name="app",
-            target=route53.RecordTarget.from_alias(targets.LoadBalancerTarget(primary_alb_dns)),
-            set_identifier="Primary",
-            failover=route53.FailoverPolicy.PRIMARY,
-            health_check_id=self.primary_health_check.attr_health_check_id,
+            "FailoverRecords",
+            hosted_zone_id=self.hosted_zone.hosted_zone_id,
+            record_sets=[
+                self._failover_record(
+                    f"app.{domain_name}.",
+                    "Primary",
+                    "PRIMARY",
+                    primary_alb_dns,
+                    primary_alb_zone_id,
+                    self.primary_health_check,
+                ),
+                self._failover_record(
+                    f"app.{domain_name}.",
+                    "DR",
+                    "SECONDARY",
+                    dr_alb_dns,
+                    dr_alb_zone_id,
+                    self.dr_health_check,
+                ),
+            ],
         )
 
-        self.dr_record = route53.ARecord(
+        # CloudWatch Alarms for health checks
+        self._create_health_check_alarms(notification_topic)
+
+    def _create_alarm_health_check(
+        self, construct_id: str, alarm_name: str, region: str
+    ) -> route53.CfnHealthCheck:
+        """Create a Route 53 health check that follows a CloudWatch alarm"""
+        return route53.CfnHealthCheck(
             self,
-            "DRRecord",
-            zone=self.hosted_zone,
-            record_name="app",
-            target=route53.RecordTarget.from_alias(targets.LoadBalancerTarget(dr_alb_dns)),
-            set_identifier="DR",
-            failover=route53.FailoverPolicy.SECONDARY,
-            health_check_id=self.dr_health_check.attr_health_check_id,
+            construct_id,
+            health_check_config=route53.CfnHealthCheck.HealthCheckConfigProperty(
+                type="CLOUDWATCH_METRIC",
+                alarm_identifier=route53.CfnHealthCheck.AlarmIdentifierProperty(
+                    name=alarm_name, region=region
+                ),
+                insufficient_data_health_status="LastKnownStatus",
+            ),
         )
 
-        # CloudWatch Alarms for health checks
-        self._create_health_check_alarms(notification_topic)
+    @staticmethod
+    def _failover_record(
+        record_name: str,
+        set_identifier: str,
+        failover: str,
+        alb_dns: str,
+        alb_zone_id: str,
+        health_check: route53.CfnHealthCheck,
+    ) -> route53.CfnRecordSetGroup.RecordSetProperty:
+        """Build a failover alias record pointing at a regional ALB"""
+        return route53.CfnRecordSetGroup.RecordSetProperty(
+            name=record_name,
+            type="A",
+            set_identifier=set_identifier,
+            failover=failover,
+            health_check_id=health_check.attr_health_check_id,
+            # Route 53 also follows the ALB's own target health, ahead of the alarm-based check
+            alias_target=route53.CfnRecordSetGroup.AliasTargetProperty(
+                dns_name=alb_dns, hosted_zone_id=alb_zone_id, evaluate_target_health=True
+            ),
+        )
 
     def _create_health_check_alarms(self, notification_topic: sns.Topic):
         """Create alarms for Route 53 health check failures"""
@@ -92,4 +132,4 @@ class GlobalDNS(Construct):
             alarm_description="Primary region health check failed",
         )
 
-        primary_alarm.add_alarm_action(cloudwatch.SnsAction(notification_topic))
+        primary_alarm.add_alarm_action(cw_actions.SnsAction(notification_topic))
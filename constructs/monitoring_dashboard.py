@@ -1,4 +1,4 @@
-from aws_cdk import aws_cloudwatch as cloudwatch, aws_logs as logs, RemovalPolicy
+from aws_cdk import aws_cloudwatch as cloudwatch, aws_logs as logs, Duration, RemovalPolicy
 from constructs import Construct
 from typing import List
 
@@ -12,14 +12,13 @@ class MonitoringDashboard(Construct):
         self,
         scope: Construct,
         construct_id: str,
-        primary_alb_arn: str,
-        dr_alb_arn: str,
-        primary_db_identifier: str,
-        dr_db_identifier: str,
+        primary_region: str,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        self.primary_region = primary_region
+
         # Log Groups
         self.dr_log_group = logs.LogGroup(
             self,
@@ -48,104 +47,68 @@ class MonitoringDashboard(Construct):
         )
 
         # Add widgets
-        self._add_infrastructure_widgets(primary_alb_arn, dr_alb_arn)
-        self._add_database_widgets(primary_db_identifier, dr_db_identifier)
+        self._add_infrastructure_widgets()
+        self._add_database_widgets()
         self._add_dr_metrics_widgets()
 
-    def _add_infrastructure_widgets(self, primary_alb_arn: str, dr_alb_arn: str):
-        """Add infrastructure monitoring widgets"""
-
-        # ALB Request Count
-        self.dashboard.add_widgets(
-            cloudwatch.GraphWidget(
-                title="ALB Request Count",
-                left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/ApplicationELB",
-                        metric_name="RequestCount",
-                        dimensions_map={"LoadBalancer": primary_alb_arn.split("/")[-1]},
-                        label="Primary Region",
-                    ),
-                    cloudwatch.Metric(
-                        namespace="AWS/ApplicationELB",
-                        metric_name="RequestCount",
-                        dimensions_map={"LoadBalancer": dr_alb_arn.split("/")[-1]},
-                        label="DR Region",
-                    ),
-                ],
-                width=12,
-                height=6,
-            )
+    def _region_search(
+        self, namespace: str, dimension: str, metric_name: str, statistic: str, label: str
+    ) -> List[cloudwatch.MathExpression]:
+        """Primary and DR series of one metric, found by SEARCH in each region"""
+        search = (
+            f"SEARCH('{{{namespace},{dimension}}} MetricName=\"{metric_name}\"', "
+            f"'{statistic}', 60)"
         )
-
-        # ALB Response Time
-        self.dashboard.add_widgets(
-            cloudwatch.GraphWidget(
-                title="ALB Response Time",
-                left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/ApplicationELB",
-                        metric_name="TargetResponseTime",
-                        dimensions_map={"LoadBalancer": primary_alb_arn.split("/")[-1]},
-                        label="Primary Region",
-                    ),
-                    cloudwatch.Metric(
-                        namespace="AWS/ApplicationELB",
-                        metric_name="TargetResponseTime",
-                        dimensions_map={"LoadBalancer": dr_alb_arn.split("/")[-1]},
-                        label="DR Region",
-                    ),
-                ],
-                width=12,
-                height=6,
+        return [
+            cloudwatch.MathExpression(
+                expression=search,
+                label=f"{region} {label}",
+                period=Duration.minutes(1),
+                search_region=search_region,
             )
-        )
+            for region, search_region in (("Primary", self.primary_region), ("DR", None))
+        ]
 
-    def _add_database_widgets(self, primary_db_id: str, dr_db_id: str):
-        """Add database monitoring widgets"""
+    def _add_infrastructure_widgets(self):
+        """Add infrastructure monitoring widgets"""
 
-        # Database CPU
+        # ALB Request Count and Response Time share a widget (one GetMetricData per widget)
         self.dashboard.add_widgets(
             cloudwatch.GraphWidget(
-                title="Database CPU Utilization",
-                left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/RDS",
-                        metric_name="CPUUtilization",
-                        dimensions_map={"DBInstanceIdentifier": primary_db_id},
-                        label="Primary DB",
-                    ),
-                    cloudwatch.Metric(
-                        namespace="AWS/RDS",
-                        metric_name="CPUUtilization",
-                        dimensions_map={"DBInstanceIdentifier": dr_db_id},
-                        label="DR DB (Read Replica)",
-                    ),
-                ],
-                width=12,
+                title="ALB Requests and Response Time",
+                left=self._region_search(
+                    "AWS/ApplicationELB", "LoadBalancer", "RequestCount", "Sum", "Requests"
+                ),
+                right=self._region_search(
+                    "AWS/ApplicationELB",
+                    "LoadBalancer",
+                    "TargetResponseTime",
+                    "Average",
+                    "Response Time",
+                ),
+                width=24,
                 height=6,
             )
         )
 
-        # Database Connections
+    def _add_database_widgets(self):
+        """Add database monitoring widgets"""
+
+        # Database CPU and Connections share a widget
         self.dashboard.add_widgets(
             cloudwatch.GraphWidget(
-                title="Database Connections",
-                left=[
-                    cloudwatch.Metric(
-                        namespace="AWS/RDS",
-                        metric_name="DatabaseConnections",
-                        dimensions_map={"DBInstanceIdentifier": primary_db_id},
-                        label="Primary DB",
-                    ),
-                    cloudwatch.Metric(
-                        namespace="AWS/RDS",
-                        metric_name="DatabaseConnections",
-                        dimensions_map={"DBInstanceIdentifier": dr_db_id},
-                        label="DR DB",
-                    ),
-                ],
-                width=12,
+                title="Database CPU Utilization and Connections",
+                left=self._region_search(
+                    "AWS/RDS", "DBInstanceIdentifier", "CPUUtilization", "Average", "CPU"
+                ),
+                right=self._region_search(
+                    "AWS/RDS",
+                    "DBInstanceIdentifier",
+                    "DatabaseConnections",
+                    "Average",
+                    "Connections",
+                ),
+                width=24,
                 height=6,
             )
         )
@@ -167,7 +130,7 @@ class MonitoringDashboard(Construct):
         self.dashboard.add_widgets(
             cloudwatch.LogQueryWidget(
                 title="DR Events",
-                log_group=self.dr_log_group,
+                log_group_names=[self.dr_log_group.log_group_name],
                 query_lines=[
                     "fields @timestamp, @message",
                     "filter @message like /DR/",
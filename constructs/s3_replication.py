@@ -1,5 +1,6 @@
 from aws_cdk import aws_s3 as s3, aws_iam as iam, aws_kms as kms, RemovalPolicy, Duration
 from constructs import Construct
+from constructs._iam_principals import S3_PRINCIPAL
 
 
 class S3Replication(Construct):
@@ -17,13 +18,16 @@ class S3Replication(Construct):
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
-        # KMS Keys for encryption
+        # KMS Keys for encryption, retained with the buckets so retained data stays readable.
+        # The logical IDs must not change: existing objects stay encrypted under these keys.
+        # Each bucket keeps its own key rather than a shared multi-region one, which would need
+        # a replica key in the DR region; S3 Bucket Keys cut the per-object KMS calls instead.
         self.source_key = kms.Key(
             self,
             "SourceKey",
             description="KMS key for source S3 bucket",
             enable_key_rotation=True,
-            removal_policy=RemovalPolicy.DESTROY,
+            removal_policy=RemovalPolicy.RETAIN,
         )
 
         self.destination_key = kms.Key(
@@ -31,9 +35,10 @@ class S3Replication(Construct):
             "DestinationKey",
             description="KMS key for destination S3 bucket",
             enable_key_rotation=True,
-            removal_policy=RemovalPolicy.DESTROY,
+            removal_policy=RemovalPolicy.RETAIN,
         )
 
+        # Buckets are retained rather than auto-emptied, which would add a custom resource per bucket
         # Source Bucket (Primary Region)
         self.source_bucket = s3.Bucket(
             self,
@@ -41,12 +46,14 @@ class S3Replication(Construct):
             versioned=True,
             encryption=s3.BucketEncryption.KMS,
             encryption_key=self.source_key,
-            removal_policy=RemovalPolicy.DESTROY,
-            auto_delete_objects=True,
+            bucket_key_enabled=True,
+            removal_policy=RemovalPolicy.RETAIN,
             lifecycle_rules=[
                 s3.LifecycleRule(
                     id="TransitionToIA",
                     enabled=True,
+                    # IA bills at least 128 KB per object, so smaller objects stay in Standard
+                    object_size_greater_than=128 * 1024,
                     transitions=[
                         s3.Transition(
                             storage_class=s3.StorageClass.INFREQUENT_ACCESS,
@@ -68,57 +75,74 @@ class S3Replication(Construct):
             versioned=True,
             encryption=s3.BucketEncryption.KMS,
             encryption_key=self.destination_key,
-            removal_policy=RemovalPolicy.DESTROY,
-            auto_delete_objects=True,
+            bucket_key_enabled=True,
+            removal_policy=RemovalPolicy.RETAIN,
         )
 
-        # Replication Role
+        # Replication Role: one statement per resource scope
+        source_arn = self.source_bucket.bucket_arn
         self.replication_role = iam.Role(
             self,
             "ReplicationRole",
-            assumed_by=iam.ServicePrincipal("s3.amazonaws.com"),
+            assumed_by=S3_PRINCIPAL,
             inline_policies={
                 "ReplicationPolicy": iam.PolicyDocument(
                     statements=[
                         iam.PolicyStatement(
-                            actions=["s3:GetObjectVersionForReplication", "s3:GetObjectVersionAcl"],
-                            resources=[f"{self.source_bucket.bucket_arn}/*"],
-                        ),
-                        iam.PolicyStatement(
-                            actions=["s3:ListBucket"], resources=[self.source_bucket.bucket_arn]
+                            actions=[
+                                "s3:GetObjectVersionForReplication",
+                                "s3:GetObjectVersionAcl",
+                                "s3:ListBucket",
+                            ],
+                            resources=[source_arn, f"{source_arn}/*"],
                         ),
                         iam.PolicyStatement(
                             actions=["s3:ReplicateObject", "s3:ReplicateDelete"],
                             resources=[f"{self.destination_bucket.bucket_arn}/*"],
                         ),
+                        # Decrypt source objects, encrypt their SSE-KMS replicas
+                        iam.PolicyStatement(
+                            actions=["kms:Decrypt"], resources=[self.source_key.key_arn]
+                        ),
                         iam.PolicyStatement(
-                            actions=["kms:Decrypt", "kms:GenerateDataKey"],
-                            resources=[self.source_key.key_arn, self.destination_key.key_arn],
+                            actions=["kms:Encrypt", "kms:GenerateDataKey"],
+                            resources=[self.destination_key.key_arn],
                         ),
                     ]
                 )
             },
         )
 
-        # Replication Configuration
-        replication_config = s3.CfnBucket.ReplicationConfigurationProperty(
-            role=self.replication_role.role_arn,
-            rules=[
-                s3.CfnBucket.ReplicationRuleProperty(
-                    id="ReplicateAll",
-                    status="Enabled",
-                    prefix="",
-                    destination=s3.CfnBucket.ReplicationDestinationProperty(
-                        bucket=self.destination_bucket.bucket_arn,
-                        storage_class="STANDARD_IA",
-                        encryption_configuration=s3.CfnBucket.EncryptionConfigurationProperty(
-                            replica_kms_key_id=self.destination_key.key_arn
-                        ),
-                    ),
-                )
-            ],
-        )
-
         # Apply replication to source bucket
         cfn_source_bucket = self.source_bucket.node.default_child
-        cfn_source_bucket.replication_configuration = replication_config
+        cfn_source_bucket.add_property_override(
+            "ReplicationConfiguration",
+            self._build_replication_config(
+                self.replication_role.role_arn,
+                self.destination_bucket.bucket_arn,
+                self.destination_key.key_arn,
+            ),
+        )
+
+    @staticmethod
+    def _build_replication_config(
+        role_arn: str, destination_bucket_arn: str, replica_kms_key_arn: str
+    ) -> dict:
+        """Build the CloudFormation ReplicationConfiguration as a plain dict"""
+        return {
+            "Role": role_arn,
+            "Rules": [
+                {
+                    "Id": "ReplicateAll",
+                    "Status": "Enabled",
+                    "Prefix": "",
+                    # Objects encrypted with the KMS key are only replicated when selected explicitly
+                    "SourceSelectionCriteria": {"SseKmsEncryptedObjects": {"Status": "Enabled"}},
+                    "Destination": {
+                        "Bucket": destination_bucket_arn,
+                        "StorageClass": "STANDARD_IA",
+                        "EncryptionConfiguration": {"ReplicaKmsKeyID": replica_kms_key_arn},
+                    },
+                }
+            ],
+        }
@@ -1,4 +1,6 @@
-from aws_cdk import aws_ec2 as ec2, aws_logs as logs, RemovalPolicy, Tags
+import ipaddress
+
+from aws_cdk import aws_ec2 as ec2, aws_s3 as s3, Duration, RemovalPolicy, Tags
 from constructs import Construct
 from typing import Optional
 
@@ -13,7 +15,9 @@ class SecureVpc(Construct):
         scope: Construct,
         construct_id: str,
         cidr: str = "10.0.0.0/16",
+        nat_gateways: int = 2,
         enable_flow_logs: bool = True,
+        flow_log_traffic_type: ec2.FlowLogTrafficType = ec2.FlowLogTrafficType.ALL,
         enable_dns_hostnames: bool = True,
         enable_dns_support: bool = True,
         **kwargs,
@@ -26,7 +30,7 @@ class SecureVpc(Construct):
             "VPC",
             ip_addresses=ec2.IpAddresses.cidr(cidr),
             max_azs=3,
-            nat_gateways=2,  # High availability
+            nat_gateways=nat_gateways,
             enable_dns_hostnames=enable_dns_hostnames,
             enable_dns_support=enable_dns_support,
             subnet_configuration=[
@@ -42,25 +46,44 @@ class SecureVpc(Construct):
             ],
         )
 
-        # VPC Flow Logs for security monitoring
+        # VPC Flow Logs for security monitoring, delivered to S3 as hourly-partitioned Parquet
         if enable_flow_logs:
-            self.flow_log_group = logs.LogGroup(
+            self.flow_log_bucket = s3.Bucket(
                 self,
-                "VPCFlowLogGroup",
-                retention=logs.RetentionDays.ONE_MONTH,
-                removal_policy=RemovalPolicy.DESTROY,
+                "VPCFlowLogBucket",
+                encryption=s3.BucketEncryption.S3_MANAGED,
+                block_public_access=s3.BlockPublicAccess.BLOCK_ALL,
+                enforce_ssl=True,
+                removal_policy=RemovalPolicy.RETAIN,
+                lifecycle_rules=[
+                    s3.LifecycleRule(
+                        id="ArchiveFlowLogs",
+                        enabled=True,
+                        transitions=[
+                            s3.Transition(
+                                storage_class=s3.StorageClass.GLACIER,
+                                transition_after=Duration.days(30),
+                            )
+                        ],
+                    )
+                ],
             )
 
             self.flow_logs = ec2.FlowLog(
                 self,
                 "VPCFlowLogs",
                 resource_type=ec2.FlowLogResourceType.from_vpc(self.vpc),
-                destination=ec2.FlowLogDestination.to_cloud_watch_logs(self.flow_log_group),
+                destination=ec2.FlowLogDestination.to_s3(
+                    self.flow_log_bucket,
+                    "vpcflow/",
+                    file_format=ec2.FlowLogFileFormat.PARQUET,
+                    hive_compatible_partitions=True,
+                    per_hour_partition=True,
+                ),
+                # REJECT captures only denied traffic when flow logs are for security monitoring
+                traffic_type=flow_log_traffic_type,
             )
 
-        # Default security group restrictions
-        self.vpc.add_flow_log("FlowLogCloudWatch")
-
         # Network ACLs for additional security layer
         self._create_network_acls()
 
@@ -82,9 +105,9 @@ class SecureVpc(Construct):
         private_nacl.add_entry(
             "AllowOutboundHTTPS",
             rule_number=100,
-            protocol=ec2.AclProtocol.tcp(),
-            rule_action=ec2.AclTrafficDirection.EGRESS,
-            port_range=ec2.AclPortRange(from_=443, to=443),
+            traffic=ec2.AclTraffic.tcp_port(443),
+            direction=ec2.TrafficDirection.EGRESS,
+            rule_action=ec2.Action.ALLOW,
             cidr=ec2.AclCidr.any_ipv4(),
         )
 
@@ -96,13 +119,16 @@ class SecureVpc(Construct):
             subnet_selection=ec2.SubnetSelection(subnet_type=ec2.SubnetType.PRIVATE_ISOLATED),
         )
 
-        # Allow MySQL from private subnets only
-        for i, subnet in enumerate(self.vpc.private_subnets):
+        # Allow MySQL from private subnets only, as the fewest CIDR blocks covering them
+        private_cidrs = ipaddress.collapse_addresses(
+            ipaddress.ip_network(subnet.ipv4_cidr_block) for subnet in self.vpc.private_subnets
+        )
+        for i, cidr in enumerate(private_cidrs):
             db_nacl.add_entry(
                 f"AllowMySQLFromPrivate{i}",
                 rule_number=100 + i,
-                protocol=ec2.AclProtocol.tcp(),
-                rule_action=ec2.AclTrafficDirection.INGRESS,
-                port_range=ec2.AclPortRange(from_=3306, to=3306),
-                cidr=ec2.AclCidr.ipv4(subnet.ipv4_cidr_block),
+                traffic=ec2.AclTraffic.tcp_port(3306),
+                direction=ec2.TrafficDirection.INGRESS,
+                rule_action=ec2.Action.ALLOW,
+                cidr=ec2.AclCidr.ipv4(str(cidr)),
             )
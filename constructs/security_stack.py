@@ -8,6 +8,7 @@ from aws_cdk import (
     RemovalPolicy,
 )
 from constructs import Construct
+from constructs._iam_principals import CONFIG_PRINCIPAL
 
 
 class SecurityStack(Construct):
@@ -85,7 +86,7 @@ class SecurityStack(Construct):
         config_role = iam.Role(
             self,
             "ConfigRole",
-            assumed_by=iam.ServicePrincipal("config.amazonaws.com"),
+            assumed_by=CONFIG_PRINCIPAL,
             managed_policies=[
                 iam.ManagedPolicy.from_aws_managed_policy_name("service-role/ConfigRole")
             ],
@@ -46,17 +46,21 @@ cdk bootstrap aws://$ACCOUNT_ID/$PRIMARY_REGION
 echo "   Bootstrapping DR region ($DR_REGION)..."
 cdk bootstrap aws://$ACCOUNT_ID/$DR_REGION
 
+# Synthesize once; every deploy below reuses the same cloud assembly instead of re-running app.py
+echo "Synthesizing infrastructure..."
+poetry run cdk synth --quiet --output cdk.out
+
 # Deploy stacks
 echo "Deploying infrastructure..."
 
 echo "   Deploying primary region stack..."
-poetry run cdk deploy EcommercePrimaryStack --require-approval never
+poetry run cdk deploy --app cdk.out EcommercePrimaryStack --require-approval never
 
 echo "   Deploying DR region stack..."
-poetry run cdk deploy EcommerceDRStack --require-approval never
+poetry run cdk deploy --app cdk.out EcommerceDRStack --require-approval never
 
 echo "   Deploying global resources..."
-poetry run cdk deploy EcommerceGlobalStack --require-approval never
+poetry run cdk deploy --app cdk.out EcommerceGlobalStack --require-approval never
 
 echo "Deployment completed successfully!"
 echo ""
@@ -1,19 +1,29 @@
 import boto3
 import json
+import logging
+from functools import lru_cache
+from string import Template
+from typing import Optional
+from botocore.config import Config
 
+logger = logging.getLogger(__name__)
 
-def setup_s3_cross_region_replication(
-    source_bucket, destination_bucket, source_region, dest_region
-):
-    """
-    Sets up S3 cross-region replication between primary and DR regions
-    """
-    s3_client = boto3.client("s3", region_name=source_region)
+# One session and client config for every call, with adaptive retries under throttling
+_session = boto3.Session()
+_client_config = Config(
+    retries={"mode": "adaptive", "max_attempts": 10}, tcp_keepalive=True, max_pool_connections=20
+)
+
+
+@lru_cache(maxsize=None)
+def _client(service: str, region: Optional[str] = None):
+    """Return a client from the shared session, cached per service and region"""
+    return _session.client(service, region_name=region, config=_client_config)
 
-    # Create replication role
-    iam = boto3.client("iam")
 
-    trust_policy = {
+# Policy documents are serialized once; only the bucket names vary between calls
+_TRUST_POLICY = json.dumps(
+    {
         "Version": "2012-10-17",
         "Statement": [
             {
@@ -22,34 +32,53 @@ def setup_s3_cross_region_replication(
                 "Action": "sts:AssumeRole",
             }
         ],
-    }
+    },
+    separators=(",", ":"),
+)
 
-    replication_policy = {
-        "Version": "2012-10-17",
-        "Statement": [
-            {
-                "Effect": "Allow",
-                "Action": ["s3:GetObjectVersionForReplication", "s3:GetObjectVersionAcl"],
-                "Resource": f"arn:aws:s3:::{source_bucket}/*",
-            },
-            {
-                "Effect": "Allow",
-                "Action": ["s3:ListBucket"],
-                "Resource": f"arn:aws:s3:::{source_bucket}",
-            },
-            {
-                "Effect": "Allow",
-                "Action": ["s3:ReplicateObject", "s3:ReplicateDelete"],
-                "Resource": f"arn:aws:s3:::{destination_bucket}/*",
-            },
-        ],
-    }
+_REPLICATION_POLICY = Template(
+    json.dumps(
+        {
+            "Version": "2012-10-17",
+            "Statement": [
+                {
+                    "Effect": "Allow",
+                    "Action": ["s3:GetObjectVersionForReplication", "s3:GetObjectVersionAcl"],
+                    "Resource": "arn:aws:s3:::${source_bucket}/*",
+                },
+                {
+                    "Effect": "Allow",
+                    "Action": ["s3:ListBucket"],
+                    "Resource": "arn:aws:s3:::${source_bucket}",
+                },
+                {
+                    "Effect": "Allow",
+                    "Action": ["s3:ReplicateObject", "s3:ReplicateDelete"],
+                    "Resource": "arn:aws:s3:::${destination_bucket}/*",
+                },
+            ],
+        },
+        separators=(",", ":"),
+    )
+)
+
+
+def setup_s3_cross_region_replication(
+    source_bucket, destination_bucket, source_region, dest_region
+):
+    """
+    Sets up S3 cross-region replication between primary and DR regions
+    """
+    s3_client = _client("s3", source_region)
+
+    # Create replication role
+    iam = _client("iam")
 
     # Create IAM role for replication
     try:
         role_response = iam.create_role(
             RoleName="S3ReplicationRole",
-            AssumeRolePolicyDocument=json.dumps(trust_policy),
+            AssumeRolePolicyDocument=_TRUST_POLICY,
             Description="Role for S3 cross-region replication",
         )
         role_arn = role_response["Role"]["Arn"]
@@ -58,11 +87,13 @@ def setup_s3_cross_region_replication(
         iam.put_role_policy(
             RoleName="S3ReplicationRole",
             PolicyName="S3ReplicationPolicy",
-            PolicyDocument=json.dumps(replication_policy),
+            PolicyDocument=_REPLICATION_POLICY.substitute(
+                source_bucket=source_bucket, destination_bucket=destination_bucket
+            ),
         )
 
     except iam.exceptions.EntityAlreadyExistsException:
-        role_arn = f"arn:aws:iam::{boto3.client('sts').get_caller_identity()['Account']}:role/S3ReplicationRole"
+        role_arn = iam.get_role(RoleName="S3ReplicationRole")["Role"]["Arn"]
 
     # Configure replication
     replication_config = {
@@ -85,10 +116,14 @@ def setup_s3_cross_region_replication(
         Bucket=source_bucket, ReplicationConfiguration=replication_config
     )
 
-    print(f"Cross-region replication configured from {source_bucket} to {destination_bucket}")
+    logger.info(
+        "Cross-region replication configured from %s to %s", source_bucket, destination_bucket
+    )
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+
     # Example usage
     setup_s3_cross_region_replication(
         source_bucket="primary-app-data-bucket",
@@ -0,0 +1,70 @@
+import boto3
+import json
+import os
+import time
+from botocore.config import Config
+from functools import lru_cache
+from typing import Dict, Any
+
+TOKEN_TTL_SECONDS = 24 * 60 * 60
+
+# Short timeouts and few retries, so a stuck API call fails the step quickly
+_client_config = Config(
+    connect_timeout=2, read_timeout=5, retries={"mode": "standard", "max_attempts": 2}
+)
+
+
+@lru_cache(maxsize=None)
+def _client(service: str, region: str):
+    """Return a boto3 client, cached for the lifetime of the Lambda container"""
+    return boto3.client(service, region_name=region, config=_client_config)
+
+
+def _resume_if_available(replica_id: str, region: str) -> bool:
+    """Send the stored task token back to Step Functions once the database is available"""
+    rds = _client("rds", region)
+    try:
+        db_response = rds.describe_db_instances(DBInstanceIdentifier=replica_id)
+    except rds.exceptions.DBInstanceNotFoundFault:
+        # A deleted or unknown instance has no failover waiting on it
+        return False
+    db_status = db_response["DBInstances"][0]["DBInstanceStatus"]
+    if db_status != "available":
+        return False
+
+    # Deleting the item claims the token, so only one caller resumes the workflow
+    claimed = _client("dynamodb", region).delete_item(
+        TableName=os.environ["TABLE_NAME"],
+        Key={"replica_id": {"S": replica_id}},
+        ReturnValues="ALL_OLD",
+    )
+    if "Attributes" not in claimed:
+        return False
+
+    _client("stepfunctions", region).send_task_success(
+        taskToken=claimed["Attributes"]["task_token"]["S"],
+        output=json.dumps({"replica_id": replica_id, "database_status": db_status}),
+    )
+    return True
+
+
+def handler(event: Dict[str, Any], context) -> Dict[str, Any]:
+    """Resume the failover workflow as soon as the promoted database is available"""
+    region = os.environ["AWS_REGION"]
+
+    # RDS event from EventBridge: resume the workflow waiting on this instance, if any
+    if "detail" in event:
+        replica_id = event["detail"]["SourceIdentifier"]
+        return {"replica_id": replica_id, "resumed": _resume_if_available(replica_id, region)}
+
+    # Step Functions callback task: store the token, then check in case RDS is already available
+    replica_id = event["replica_id"]
+    _client("dynamodb", region).put_item(
+        TableName=os.environ["TABLE_NAME"],
+        Item={
+            "replica_id": {"S": replica_id},
+            "task_token": {"S": event["task_token"]},
+            "expires_at": {"N": str(int(time.time()) + TOKEN_TTL_SECONDS)},
+        },
+    )
+    return {"replica_id": replica_id, "resumed": _resume_if_available(replica_id, region)}
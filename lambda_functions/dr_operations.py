@@ -0,0 +1,23 @@
+from typing import Dict, Any
+
+import db_available
+import failover
+import health_check
+
+# One function serves every DR step, so back-to-back steps reuse the same warm container
+ACTIONS = {
+    "failover": failover.handler,
+    "health_check": health_check.handler,
+    "db_available": db_available.handler,
+}
+
+
+def handler(event: Dict[str, Any], context) -> Dict[str, Any]:
+    """Dispatch a DR operation event of the form {"action": ..., "input": {...}}"""
+    # Warm-up invocation: initialise the clients of every step on the critical path
+    if event.get("warmup"):
+        for action in ("failover", "health_check"):
+            ACTIONS[action]({"warmup": True}, context)
+        return {"warm": True}
+
+    return ACTIONS[event["action"]](event.get("input", {}), context)
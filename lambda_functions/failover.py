@@ -1,46 +1,115 @@
 import boto3
-import json
-from typing import Dict, Any
+import logging
+import os
+import time
+from botocore.config import Config
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Any, Callable, Dict, List
+
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+# Adaptive retries back off client-side so throttled polls don't compound during a failover
+_client_config = Config(
+    connect_timeout=2, read_timeout=10, retries={"mode": "adaptive", "max_attempts": 10}
+)
+
+# Polls stop this long before the Lambda timeout, so a slow failover still returns its 500 body
+RESPONSE_MARGIN_SECONDS = 60
+POLL_DELAY_SECONDS = 10
+
+
+@lru_cache(maxsize=None)
+def _client(service: str, region: str):
+    """Return a boto3 client, cached for the lifetime of the Lambda container"""
+    return boto3.client(service, region_name=region, config=_client_config)
+
+
+def _run_concurrently(*calls: Callable[[], Any]) -> List[Any]:
+    """Run independent AWS calls in parallel, raising the first failure once all have ended"""
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [executor.submit(call) for call in calls]
+        done, _ = wait(futures, return_when=FIRST_EXCEPTION)
+        # Leaving the block waits for calls still running, so none outlives the invocation
+        # and keeps calling AWS from a frozen or reused container
+
+    for future in done:
+        if future.exception():
+            raise future.exception()
+    return [future.result() for future in futures]
+
+
+def _poll_attempts(context, max_attempts: int) -> int:
+    """Cap a poll's attempts so it ends RESPONSE_MARGIN_SECONDS before the invocation times out"""
+    if context is None:
+        return max_attempts
+    remaining = context.get_remaining_time_in_millis() / 1000 - RESPONSE_MARGIN_SECONDS
+    return max(1, min(max_attempts, int(remaining // POLL_DELAY_SECONDS)))
+
+
+def _wait_for_group_in_service(
+    autoscaling,
+    asg_name: str,
+    capacity: int,
+    delay: int = POLL_DELAY_SECONDS,
+    max_attempts: int = 60,
+) -> None:
+    """Poll until the group has `capacity` InService instances (boto3 has no autoscaling waiters)"""
+    for _ in range(max_attempts):
+        groups = autoscaling.describe_auto_scaling_groups(AutoScalingGroupNames=[asg_name])
+        instances = (
+            groups["AutoScalingGroups"][0]["Instances"] if groups["AutoScalingGroups"] else []
+        )
+        if sum(1 for i in instances if i["LifecycleState"] == "InService") >= capacity:
+            return
+        time.sleep(delay)
+    raise TimeoutError(f"{asg_name} did not reach {capacity} InService instances")
 
 
 def handler(event: Dict[str, Any], context) -> Dict[str, Any]:
     """Handle DR failover operations"""
-    print(f"Starting DR failover: {json.dumps(event)}")
-
     region = event.get("dr_region", "ap-southeast-1")
     asg_name = event.get("asg_name")
     replica_id = event.get("replica_id")
     target_capacity = event.get("target_capacity", 2)
 
-    autoscaling = boto3.client("autoscaling", region_name=region)
-    rds = boto3.client("rds", region_name=region)
+    autoscaling = _client("autoscaling", region)
+    rds = _client("rds", region)
 
-    try:
-        # Scale up Auto Scaling Group
-        autoscaling.update_auto_scaling_group(
-            AutoScalingGroupName=asg_name, DesiredCapacity=target_capacity, MinSize=target_capacity
-        )
+    # Warm-up invocation: the container and clients are now initialised
+    if event.get("warmup"):
+        return {"warm": True}
 
-        # Promote read replica
-        rds.promote_read_replica(DBInstanceIdentifier=replica_id)
+    # %-style arguments are only formatted when the record is emitted
+    logger.info("Starting DR failover: %s", event)
 
-        # Wait for resources to be ready
-        autoscaling.get_waiter("group_in_service").wait(
-            AutoScalingGroupNames=[asg_name], WaiterConfig={"Delay": 30, "MaxAttempts": 20}
+    try:
+        # Scale up Auto Scaling Group and promote read replica (independent calls)
+        _run_concurrently(
+            lambda: autoscaling.update_auto_scaling_group(
+                AutoScalingGroupName=asg_name,
+                DesiredCapacity=target_capacity,
+                MinSize=target_capacity,
+            ),
+            lambda: rds.promote_read_replica(DBInstanceIdentifier=replica_id),
         )
 
-        rds.get_waiter("db_instance_available").wait(
-            DBInstanceIdentifier=replica_id, WaiterConfig={"Delay": 30, "MaxAttempts": 40}
+        # Wait for the instances, short of the Lambda timeout. The promotion continues
+        # meanwhile; the WaitForDatabase state resumes on its availability event
+        _wait_for_group_in_service(
+            autoscaling, asg_name, target_capacity, max_attempts=_poll_attempts(context, 60)
         )
 
         return {
             "statusCode": 200,
             "body": {
-                "message": "DR failover completed",
+                "message": "DR instances in service, replica promotion under way",
                 "asg_name": asg_name,
                 "replica_id": replica_id,
             },
         }
 
     except Exception as e:
+        logger.exception("DR failover failed")
         return {"statusCode": 500, "body": {"error": str(e), "message": "DR failover failed"}}
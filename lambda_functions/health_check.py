@@ -1,15 +1,78 @@
 import boto3
 import json
-import requests
-from typing import Dict, Any
+import os
+import time
+from botocore.config import Config
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Tuple
+from urllib3 import PoolManager, Retry, Timeout
+
+# urllib3 ships with boto3 in the Lambda runtime; the pool is reused across warm invocations.
+# A short connect timeout lets an unreachable ALB fail fast instead of holding the invocation.
+# Failed requests aren't retried, but one redirect is followed: with a certificate the ALB
+# redirects port 80 to HTTPS, and alb_dns must then be a name the certificate covers
+_http = PoolManager(
+    num_pools=2,
+    maxsize=4,
+    timeout=Timeout(connect=2, read=5),
+    retries=Retry(total=None, connect=0, read=0, status=0, other=0, redirect=1),
+)
+
+# Recent RDS statuses keyed by (region, instance), so frequent checks don't hammer the RDS API
+DB_STATUS_TTL_SECONDS = 15
+_db_status_cache: Dict[Tuple[str, str], Tuple[float, str]] = {}
+
+# Short timeouts and few retries, so a stuck API call fails the step quickly
+_client_config = Config(
+    connect_timeout=2, read_timeout=5, retries={"mode": "standard", "max_attempts": 2}
+)
+
+
+@lru_cache(maxsize=None)
+def _client(service: str, region: str):
+    """Return a boto3 client, cached for the lifetime of the Lambda container"""
+    return boto3.client(service, region_name=region, config=_client_config)
+
+
+def _check_alb(alb_dns: str) -> bool:
+    """Return whether the ALB health endpoint answers 200, following its redirect to HTTPS"""
+    response = _http.request("GET", f"http://{alb_dns}/health")
+    return response.status == 200
+
+
+def _check_database(db_identifier: str, region: str) -> bool:
+    """Return whether the RDS instance is available, reusing a status fetched in the last 15s"""
+    now = time.monotonic()
+    cached = _db_status_cache.get((region, db_identifier))
+    if cached and now - cached[0] < DB_STATUS_TTL_SECONDS:
+        return cached[1] == "available"
+
+    db_response = _client("rds", region).describe_db_instances(DBInstanceIdentifier=db_identifier)
+    status = db_response["DBInstances"][0]["DBInstanceStatus"]
+    _db_status_cache[(region, db_identifier)] = (now, status)
+    return status == "available"
+
+
+def _record(health_status: Dict[str, Any], key: str, check: Future) -> None:
+    """Store a probe's result, or its error, so one failed probe doesn't mask the other"""
+    if check.exception():
+        health_status.setdefault("errors", {})[key] = str(check.exception())
+    else:
+        health_status[key] = check.result()
 
 
 def handler(event: Dict[str, Any], context) -> Dict[str, Any]:
     """Comprehensive health checks for DR validation"""
-    region = event.get("region")
+    region = event.get("region", os.environ.get("AWS_REGION"))
     alb_dns = event.get("alb_dns")
     db_identifier = event.get("db_identifier")
 
+    # Warm-up invocation: initialise the container and the RDS client only
+    if event.get("warmup"):
+        _client("rds", region)
+        return {"warm": True}
+
     health_status = {
         "region": region,
         "alb_healthy": False,
@@ -18,20 +81,30 @@ def handler(event: Dict[str, Any], context) -> Dict[str, Any]:
     }
 
     try:
-        # Check ALB health
-        if alb_dns:
-            response = requests.get(f"http://{alb_dns}/health", timeout=10)
-            health_status["alb_healthy"] = response.status_code == 200
-
-        # Check database health
-        if db_identifier:
-            rds = boto3.client("rds", region_name=region)
-            db_response = rds.describe_db_instances(DBInstanceIdentifier=db_identifier)
-            db_status = db_response["DBInstances"][0]["DBInstanceStatus"]
-            health_status["database_healthy"] = db_status == "available"
-
-        health_status["overall_healthy"] = (
-            health_status["alb_healthy"] and health_status["database_healthy"]
+        # Probe the ALB and the database concurrently; latency is the slower of the two
+        executor = ThreadPoolExecutor(max_workers=2)
+        try:
+            alb_check = executor.submit(_check_alb, alb_dns) if alb_dns else None
+            db_check = (
+                executor.submit(_check_database, db_identifier, region) if db_identifier else None
+            )
+
+            if alb_check:
+                _record(health_status, "alb_healthy", alb_check)
+
+            # A down ALB already fails the check, so drop the database probe instead of waiting
+            if alb_check and not health_status["alb_healthy"]:
+                if db_check:
+                    db_check.cancel()
+                del health_status["database_healthy"]
+                health_status["database_check"] = "skipped"
+            elif db_check:
+                _record(health_status, "database_healthy", db_check)
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        health_status["overall_healthy"] = health_status["alb_healthy"] and health_status.get(
+            "database_healthy", False
         )
 
         return {"statusCode": 200, "body": health_status}
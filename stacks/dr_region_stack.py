@@ -1,4 +1,4 @@
-from aws_cdk import Stack, aws_ec2 as ec2, aws_sns as sns, Tags
+from aws_cdk import Stack, aws_ec2 as ec2, aws_iam as iam, aws_sns as sns, Tags
 from constructs import Construct
 from constructs.secure_vpc import SecureVpc
 from constructs.ecommerce_database import EcommerceDatabase
@@ -19,6 +19,9 @@ class DRRegionStack(Stack):
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        # This stack's region settings, bound once
+        region_config = config.dr_region
+
         # SNS Topic for DR notifications
         self.notification_topic = sns.Topic(
             self, "DRNotificationTopic", display_name="DR Region Notifications"
@@ -26,7 +29,11 @@ class DRRegionStack(Stack):
 
         # Secure VPC (cost-optimized for pilot light)
         self.vpc_construct = SecureVpc(
-            self, "DRVPC", cidr=config.dr_region.vpc_cidr, enable_flow_logs=True
+            self,
+            "DRVPC",
+            cidr=region_config.vpc_cidr,
+            nat_gateways=region_config.nat_gateways,
+            enable_flow_logs=True,
         )
         self.vpc = self.vpc_construct.vpc
 
@@ -38,8 +45,8 @@ class DRRegionStack(Stack):
             description="DR Security group for web servers",
             allow_all_outbound=True,
         )
-        self.web_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(80))
-        self.web_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(443))
+        # Instances only take traffic from the ALB; registering the ASG as a target opens
+        # the target port from alb_sg, so no internet-facing rules are needed here
 
         self.alb_sg = ec2.SecurityGroup(
             self,
@@ -79,26 +86,37 @@ class DRRegionStack(Stack):
             "DRCompute",
             vpc=self.vpc,
             config=config.compute,
-            security_groups=[self.web_sg, self.alb_sg],
+            instance_security_group=self.web_sg,
+            alb_security_group=self.alb_sg,
             notification_topic=self.notification_topic,
             is_pilot_light=True,  # This scales ASG to 0
+            certificate_arn=region_config.certificate_arn,
+        )
+        # The app data bucket and database secret only exist in the primary region, which is
+        # down when DR runs, so DR instances keep unscoped access until DR-region copies exist
+        self.compute_construct.instance_role.add_to_policy(
+            iam.PolicyStatement(
+                actions=["s3:GetObject", "s3:PutObject", "secretsmanager:GetSecretValue"],
+                resources=["*"],
+            )
         )
         self.load_balancer = self.compute_construct.load_balancer
         self.auto_scaling_group = self.compute_construct.auto_scaling_group
 
         # DR Orchestrator
         self.dr_orchestrator = DROrchestrator(
-            self, "DROrchestrator", notification_topic=self.notification_topic
+            self,
+            "DROrchestrator",
+            notification_topic=self.notification_topic,
+            replica_database=self.database,
+            pilot_light_alarm=self.compute_construct.healthy_hosts_alarm,
         )
 
         # Monitoring Dashboard
         self.monitoring = MonitoringDashboard(
             self,
             "Monitoring",
-            primary_alb_arn="primary-alb-arn",  # Would be passed from primary stack
-            dr_alb_arn=self.load_balancer.load_balancer_arn,
-            primary_db_identifier="primary-db-id",  # Would be passed from primary stack
-            dr_db_identifier=self.database.instance_identifier,
+            primary_region=config.primary_region.region,
         )
 
         # Tags
@@ -2,6 +2,7 @@ from aws_cdk import Stack, aws_sns as sns, Tags
 from constructs import Construct
 from constructs.global_dns import GlobalDNS
 from config.environments import EnvironmentConfig
+from typing import Optional
 
 
 class GlobalResourcesStack(Stack):
@@ -11,8 +12,13 @@ class GlobalResourcesStack(Stack):
         construct_id: str,
         config: EnvironmentConfig,
         primary_alb_dns: str,
+        primary_alb_zone_id: str,
         dr_alb_dns: str,
+        dr_alb_zone_id: str,
+        primary_health_alarm_name: str,
+        dr_health_alarm_name: str,
         domain_name: str = "ecommerce-dr-demo.com",
+        hosted_zone_id: Optional[str] = None,
         **kwargs,
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
@@ -28,8 +34,15 @@ class GlobalResourcesStack(Stack):
             "GlobalDNS",
             domain_name=domain_name,
             primary_alb_dns=primary_alb_dns,
+            primary_alb_zone_id=primary_alb_zone_id,
             dr_alb_dns=dr_alb_dns,
+            dr_alb_zone_id=dr_alb_zone_id,
+            primary_health_alarm_name=primary_health_alarm_name,
+            dr_health_alarm_name=dr_health_alarm_name,
+            primary_region=config.primary_region.region,
+            dr_region=config.dr_region.region,
             notification_topic=self.global_notification_topic,
+            hosted_zone_id=hosted_zone_id,
         )
 
         # Tags
@@ -14,6 +14,9 @@ class PrimaryRegionStack(Stack):
     ) -> None:
         super().__init__(scope, construct_id, **kwargs)
 
+        # This stack's region settings, bound once
+        region_config = config.primary_region
+
         # SNS Topic for notifications
         self.notification_topic = sns.Topic(
             self, "NotificationTopic", display_name="E-commerce DR Notifications"
@@ -21,7 +24,11 @@ class PrimaryRegionStack(Stack):
 
         # Secure VPC
         self.vpc_construct = SecureVpc(
-            self, "VPC", cidr=config.primary_region.vpc_cidr, enable_flow_logs=True
+            self,
+            "VPC",
+            cidr=region_config.vpc_cidr,
+            nat_gateways=region_config.nat_gateways,
+            enable_flow_logs=True,
         )
         self.vpc = self.vpc_construct.vpc
 
@@ -33,8 +40,8 @@ class PrimaryRegionStack(Stack):
             description="Security group for web servers",
             allow_all_outbound=True,
         )
-        self.web_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(80))
-        self.web_sg.add_ingress_rule(ec2.Peer.any_ipv4(), ec2.Port.tcp(443))
+        # Instances only take traffic from the ALB; registering the ASG as a target opens
+        # the target port from alb_sg, so no internet-facing rules are needed here
 
         self.alb_sg = ec2.SecurityGroup(
             self,
@@ -67,27 +74,31 @@ class PrimaryRegionStack(Stack):
         )
         self.database = self.database_construct.database
 
+        # S3 Replication
+        self.s3_replication = S3Replication(
+            self,
+            "S3Replication",
+            source_region=region_config.region,
+            destination_region=config.dr_region.region,
+        )
+
         # Compute Infrastructure
         self.compute_construct = EcommerceCompute(
             self,
             "Compute",
             vpc=self.vpc,
             config=config.compute,
-            security_groups=[self.web_sg, self.alb_sg],
+            instance_security_group=self.web_sg,
+            alb_security_group=self.alb_sg,
             notification_topic=self.notification_topic,
             is_pilot_light=False,
+            certificate_arn=region_config.certificate_arn,
+            bucket=self.s3_replication.source_bucket,
+            secret=self.database_construct.db_secret,
         )
         self.load_balancer = self.compute_construct.load_balancer
         self.auto_scaling_group = self.compute_construct.auto_scaling_group
 
-        # S3 Replication
-        self.s3_replication = S3Replication(
-            self,
-            "S3Replication",
-            source_region=config.primary_region.region,
-            destination_region=config.dr_region.region,
-        )
-
         # Security Stack
         self.security = SecurityStack(self, "Security", notification_topic=self.notification_topic)
 
@@ -0,0 +1,6 @@
+import sys
+from pathlib import Path
+
+# The Lambda asset is the lambda_functions directory itself, so its handlers import each
+# other as top-level modules (e.g. "import failover"); load them the same way in tests
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "lambda_functions"))
@@ -1,28 +1,60 @@
+import dataclasses
+import operator
+import subprocess
+import sys
+from pathlib import Path
+
 import pytest
 from config.environments import PRODUCTION_CONFIG
 
 
+# Expected production values, keyed by attribute path on the config
+PRODUCTION_EXPECTATIONS = [
+    ("environment_name", "production"),
+    ("primary_region.region", "ap-southeast-2"),
+    ("dr_region.region", "ap-southeast-1"),
+    ("database.encrypted", True),
+    ("enable_deletion_protection", True),
+]
+
+
+@pytest.fixture(scope="module")
+def config():
+    return PRODUCTION_CONFIG
+
+
 class TestEnvironmentConfig:
     """Test environment configuration"""
 
-    def test_production_config(self):
+    @pytest.mark.parametrize("path,expected", PRODUCTION_EXPECTATIONS)
+    def test_production_config(self, config, path, expected):
         """Test production configuration is valid"""
-        config = PRODUCTION_CONFIG
+        value = operator.attrgetter(path)(config)
 
-        assert config.environment_name == "production"
-        assert config.primary_region.region == "ap-southeast-2"
-        assert config.dr_region.region == "ap-southeast-1"
-        assert config.database.encrypted is True
-        assert config.enable_deletion_protection is True
+        assert value == expected
+        assert type(value) is type(expected)
 
-    def test_regions_are_different(self):
+    def test_regions_are_different(self, config):
         """Test primary and DR regions are different"""
-        config = PRODUCTION_CONFIG
-
         assert config.primary_region.region != config.dr_region.region
 
-    def test_vpc_cidrs_are_different(self):
+    def test_vpc_cidrs_are_different(self, config):
         """Test VPC CIDRs don't overlap"""
-        config = PRODUCTION_CONFIG
-
         assert config.primary_region.vpc_cidr != config.dr_region.vpc_cidr
+
+    def test_config_is_immutable(self, config):
+        """Test configuration cannot be mutated and is hashable"""
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.primary_region.region = "us-east-1"
+
+        assert hash(config) == hash(PRODUCTION_CONFIG)
+
+    def test_config_does_not_import_cdk(self):
+        """Test config stays plain data, so config tests never load aws_cdk"""
+        check = "import sys, config.environments; sys.exit('aws_cdk' in sys.modules)"
+
+        result = subprocess.run(
+            [sys.executable, "-c", check], cwd=Path(__file__).resolve().parents[1]
+        )
+
+        assert result.returncode == 0
@@ -0,0 +1,256 @@
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from unittest.mock import MagicMock
+
+import pytest
+
+import db_available
+import dr_operations
+import failover
+import health_check
+
+
+@pytest.fixture
+def clients(monkeypatch):
+    """Replace each handler module's cached boto3 clients with one mock per service"""
+    mocks = {}
+
+    def fake_client(service, region):
+        return mocks.setdefault(service, MagicMock(name=service))
+
+    for module in (db_available, failover, health_check):
+        monkeypatch.setattr(module, "_client", fake_client)
+    return mocks
+
+
+def _db_status(status):
+    return {"DBInstances": [{"DBInstanceStatus": status}]}
+
+
+class TestDatabaseAvailable:
+    """Test the callback that resumes a failover waiting on the promoted database"""
+
+    @pytest.fixture(autouse=True)
+    def env(self, monkeypatch):
+        monkeypatch.setenv("TABLE_NAME", "tokens")
+        monkeypatch.setenv("AWS_REGION", "ap-southeast-1")
+
+    def test_task_stores_token_and_resumes_when_available(self, clients):
+        clients["rds"] = MagicMock(
+            **{"describe_db_instances.return_value": _db_status("available")}
+        )
+        clients["dynamodb"] = MagicMock(
+            **{"delete_item.return_value": {"Attributes": {"task_token": {"S": "token"}}}}
+        )
+
+        result = db_available.handler({"replica_id": "replica", "task_token": "token"}, None)
+
+        assert result == {"replica_id": "replica", "resumed": True}
+        item = clients["dynamodb"].put_item.call_args.kwargs["Item"]
+        assert item["task_token"] == {"S": "token"}
+        assert int(item["expires_at"]["N"]) > time.time()
+        clients["stepfunctions"].send_task_success.assert_called_once()
+        assert clients["stepfunctions"].send_task_success.call_args.kwargs["taskToken"] == "token"
+
+    def test_task_waits_while_database_is_unavailable(self, clients):
+        clients["rds"] = MagicMock(
+            **{"describe_db_instances.return_value": _db_status("modifying")}
+        )
+
+        result = db_available.handler({"replica_id": "replica", "task_token": "token"}, None)
+
+        assert result["resumed"] is False
+        clients["dynamodb"].put_item.assert_called_once()
+        clients["dynamodb"].delete_item.assert_not_called()
+        assert "stepfunctions" not in clients
+
+    def test_event_does_not_resume_a_token_claimed_elsewhere(self, clients):
+        clients["rds"] = MagicMock(
+            **{"describe_db_instances.return_value": _db_status("available")}
+        )
+        # The other caller already deleted the item, so nothing comes back
+        clients["dynamodb"] = MagicMock(**{"delete_item.return_value": {}})
+
+        result = db_available.handler({"detail": {"SourceIdentifier": "replica"}}, None)
+
+        assert result == {"replica_id": "replica", "resumed": False}
+        assert "stepfunctions" not in clients
+
+    def test_event_for_unknown_instance_returns_early(self, clients):
+        not_found = type("DBInstanceNotFoundFault", (Exception,), {})
+        clients["rds"] = MagicMock()
+        clients["rds"].exceptions.DBInstanceNotFoundFault = not_found
+        clients["rds"].describe_db_instances.side_effect = not_found("deleted")
+
+        result = db_available.handler({"detail": {"SourceIdentifier": "deleted-db"}}, None)
+
+        assert result == {"replica_id": "deleted-db", "resumed": False}
+        assert "dynamodb" not in clients
+
+
+class TestFailover:
+    """Test the failover handler's concurrency helper"""
+
+    def test_run_concurrently_returns_results_in_order(self):
+        assert failover._run_concurrently(lambda: 1, lambda: 2) == [1, 2]
+
+    def test_run_concurrently_raises_failure_after_other_calls_finish(self):
+        finished = threading.Event()
+
+        def slow():
+            time.sleep(0.2)
+            finished.set()
+
+        def fail():
+            raise ValueError("promotion failed")
+
+        with pytest.raises(ValueError, match="promotion failed"):
+            failover._run_concurrently(slow, fail)
+        assert finished.is_set()
+
+    def test_warmup_skips_failover_calls(self, clients):
+        assert failover.handler({"warmup": True}, None) == {"warm": True}
+        clients["autoscaling"].update_auto_scaling_group.assert_not_called()
+        clients["rds"].promote_read_replica.assert_not_called()
+
+
+class TestDROperations:
+    """Test the single-function dispatcher"""
+
+    @pytest.fixture
+    def actions(self, monkeypatch):
+        mocks = {}
+        for action in dr_operations.ACTIONS:
+            mocks[action] = MagicMock(return_value={"action": action})
+            monkeypatch.setitem(dr_operations.ACTIONS, action, mocks[action])
+        return mocks
+
+    def test_dispatches_input_to_action(self, actions):
+        context = object()
+
+        result = dr_operations.handler(
+            {"action": "failover", "input": {"asg_name": "asg"}}, context
+        )
+
+        assert result == {"action": "failover"}
+        actions["failover"].assert_called_once_with({"asg_name": "asg"}, context)
+
+    def test_missing_input_defaults_to_empty(self, actions):
+        dr_operations.handler({"action": "health_check"}, None)
+        actions["health_check"].assert_called_once_with({}, None)
+
+    def test_warmup_initialises_critical_path_steps(self, actions):
+        assert dr_operations.handler({"warmup": True}, None) == {"warm": True}
+        actions["failover"].assert_called_once_with({"warmup": True}, None)
+        actions["health_check"].assert_called_once_with({"warmup": True}, None)
+        actions["db_available"].assert_not_called()
+
+
+class TestHealthCheck:
+    """Test the health check's RDS status cache"""
+
+    @pytest.fixture(autouse=True)
+    def empty_cache(self, monkeypatch):
+        monkeypatch.setattr(health_check, "_db_status_cache", {})
+
+    @pytest.fixture
+    def alb(self):
+        """Local stand-in for an ALB whose port 80 redirects, as it does with a certificate"""
+
+        class RedirectingALB(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == "/health":
+                    self.send_response(301)
+                    self.send_header("Location", f"http://{self.headers['Host']}/secure/health")
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(("127.0.0.1", 0), RedirectingALB)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        yield f"127.0.0.1:{server.server_port}"
+        server.shutdown()
+        server.server_close()
+
+    def test_alb_check_follows_listener_redirect(self, alb):
+        assert health_check._check_alb(alb) is True
+
+    def test_database_status_is_cached(self, clients, monkeypatch):
+        clients["rds"] = MagicMock(
+            **{"describe_db_instances.return_value": _db_status("available")}
+        )
+        now = [100.0]
+        monkeypatch.setattr(health_check.time, "monotonic", lambda: now[0])
+
+        assert health_check._check_database("db", "ap-southeast-1") is True
+        now[0] += health_check.DB_STATUS_TTL_SECONDS - 1
+        assert health_check._check_database("db", "ap-southeast-1") is True
+        assert clients["rds"].describe_db_instances.call_count == 1
+
+        # Once the entry expires the status is fetched again
+        now[0] += 1
+        clients["rds"].describe_db_instances.return_value = _db_status("failed")
+        assert health_check._check_database("db", "ap-southeast-1") is False
+        assert clients["rds"].describe_db_instances.call_count == 2
+
+    def test_probes_run_concurrently(self, monkeypatch):
+        # Each probe blocks until the other has started, so serial probes would time out
+        started = threading.Barrier(2, timeout=2)
+        monkeypatch.setattr(health_check, "_check_alb", lambda alb_dns: started.wait() >= 0)
+        monkeypatch.setattr(health_check, "_check_database", lambda *args: started.wait() >= 0)
+
+        result = health_check.handler(
+            {"region": "ap-southeast-1", "alb_dns": "alb", "db_identifier": "db"}, None
+        )
+
+        assert "errors" not in result["body"]
+        assert result["body"]["overall_healthy"] is True
+
+    def test_failed_probe_does_not_mask_the_other(self, monkeypatch):
+        def fail(*args):
+            raise RuntimeError("throttled")
+
+        monkeypatch.setattr(health_check, "_check_alb", lambda alb_dns: True)
+        monkeypatch.setattr(health_check, "_check_database", fail)
+
+        result = health_check.handler(
+            {"region": "ap-southeast-1", "alb_dns": "alb", "db_identifier": "db"}, None
+        )
+
+        assert result["body"]["alb_healthy"] is True
+        assert result["body"]["errors"] == {"database_healthy": "throttled"}
+        assert result["body"]["overall_healthy"] is False
+
+    def test_down_alb_skips_database_without_waiting(self, monkeypatch):
+        release = threading.Event()
+        monkeypatch.setattr(health_check, "_check_alb", lambda alb_dns: False)
+        monkeypatch.setattr(health_check, "_check_database", lambda *args: release.wait(5))
+
+        start = time.monotonic()
+        try:
+            result = health_check.handler(
+                {"region": "ap-southeast-1", "alb_dns": "alb", "db_identifier": "db"}, None
+            )
+            assert time.monotonic() - start < 1
+        finally:
+            release.set()
+
+        assert result["body"]["database_check"] == "skipped"
+        assert "database_healthy" not in result["body"]
+        assert result["body"]["overall_healthy"] is False
+
+    def test_cache_is_keyed_by_region(self, clients):
+        clients["rds"] = MagicMock(
+            **{"describe_db_instances.return_value": _db_status("available")}
+        )
+
+        health_check._check_database("db", "ap-southeast-1")
+        health_check._check_database("db", "ap-southeast-2")
+
+        assert clients["rds"].describe_db_instances.call_count == 2